@@ -0,0 +1,56 @@
+# inventory_system/backend/database.py
+"""
+Connection pool configuration for the shared SQLAlchemy engine.
+
+Every ``rx.session()`` checks a connection out of the engine returned by
+``reflex.model.get_engine``. Reflex builds that engine with SQLAlchemy's default
+pool (5 connections, 10 overflow, no recycling); this module registers a sized
+pool for the configured ``db_url`` before the first session is opened so that
+bursts of concurrent requests (e.g. supplier registrations) reuse warm
+connections instead of queuing or re-handshaking.
+
+Deployment knobs (environment variables):
+
+- ``DB_POOL_SIZE``: persistent connections kept open (default 10)
+- ``DB_MAX_OVERFLOW``: extra connections allowed under burst load (default 20)
+- ``DB_POOL_RECYCLE``: seconds before a connection is replaced (default 1800)
+- ``DB_POOL_TIMEOUT``: seconds to wait for a free connection (default 30)
+
+Stale connections are detected with ``pool_pre_ping`` and transparently
+reopened, e.g. after a database restart or an idle timeout on a proxy.
+"""
+
+import os
+
+import reflex as rx
+import sqlmodel
+from reflex import model as rx_model
+
+from inventory_system.logging.logging import audit_logger
+
+
+def get_pool_settings() -> dict:
+    """Read pool sizing from environment variables, with production defaults."""
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_pre_ping": True,
+    }
+
+
+def configure_engine_pool() -> None:
+    """Register a pooled engine for ``db_url`` in Reflex's engine cache.
+
+    Must run before the first ``rx.session()``; later calls are no-ops. SQLite
+    URLs are skipped since they do not use a sized ``QueuePool``.
+    """
+    url = rx.config.get_config().db_url
+    if not url or url.startswith("sqlite") or url in rx_model._ENGINE:
+        return
+
+    pool_settings = get_pool_settings()
+    engine_args = {**rx_model.get_engine_args(url), **pool_settings}
+    rx_model._ENGINE[url] = sqlmodel.create_engine(url, **engine_args)
+    audit_logger.info("db_engine_pool_configured", **pool_settings)
@@ -1,4 +1,5 @@
 import csv
+from operator import attrgetter
 from pathlib import Path
 from typing import List
 
@@ -27,42 +28,40 @@ class TableState(rx.State):
     offset: int = 0
     limit: int = 12  # Number of rows per page
 
+    # Backend-only: computed once per items/search/sort change and never sent
+    # to the client; total_pages and get_current_page read it directly.
     @rx.var(cache=True)
-    def filtered_sorted_items(self) -> List[Item]:
+    def _filtered_sorted_items(self) -> List[Item]:
         items = self.items
 
-        # Filter items based on selected item
+        # Filter first so only the matching items get sorted
+        if self.search_value:
+            search_value = self.search_value.lower()
+            items = [
+                item
+                for item in items
+                if any(
+                    search_value in str(getattr(item, attr)).lower()
+                    for attr in ("name", "payment", "date", "status")
+                )
+            ]
+
         if self.sort_value:
+            # Resolve the state var once, not once per item in the key function
+            get_value = attrgetter(self.sort_value)
             if self.sort_value in ["payment"]:
                 items = sorted(
                     items,
-                    key=lambda item: float(getattr(item, self.sort_value)),
+                    key=lambda item: float(get_value(item)),
                     reverse=self.sort_reverse,
                 )
             else:
                 items = sorted(
                     items,
-                    key=lambda item: str(getattr(item, self.sort_value)).lower(),
+                    key=lambda item: str(get_value(item)).lower(),
                     reverse=self.sort_reverse,
                 )
 
-        # Filter items based on search value
-        if self.search_value:
-            search_value = self.search_value.lower()
-            items = [
-                item
-                for item in items
-                if any(
-                    search_value in str(getattr(item, attr)).lower()
-                    for attr in [
-                        "name",
-                        "payment",
-                        "date",
-                        "status",
-                    ]
-                )
-            ]
-
         return items
 
     @rx.var(cache=True)
@@ -71,15 +70,14 @@ class TableState(rx.State):
 
     @rx.var(cache=True)
     def total_pages(self) -> int:
-        return (self.total_items // self.limit) + (
-            1 if self.total_items % self.limit else 1
-        )
+        matched = len(self._filtered_sorted_items)
+        return max(1, (matched + self.limit - 1) // self.limit)
 
     @rx.var(cache=True, initial_value=[])
     def get_current_page(self) -> list[Item]:
         start_index = self.offset
         end_index = start_index + self.limit
-        return self.filtered_sorted_items[start_index:end_index]
+        return self._filtered_sorted_items[start_index:end_index]
 
     def prev_page(self):
         if self.page_number > 1:
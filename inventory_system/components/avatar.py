@@ -48,6 +48,7 @@ def user_avatar() -> rx.Component:
                         "Profile",
                         on_click=lambda: rx.redirect(routes.PROFILE_ROUTE),
                         style=menu_item_style,
+                        data_testid="profile-menuitem",
                     ),
                     rx.menu.item(
                         "Settings",
@@ -59,6 +60,7 @@ def user_avatar() -> rx.Component:
                         "Logout",
                         on_click=LogoutState.toggle_dialog,
                         style=menu_item_style,
+                        data_testid="logout-menuitem",
                     ),
                     # Ensure menu content background is consistent
                     background_color=rx.color("gray", 1),  # Match navbar background
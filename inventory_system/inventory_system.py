@@ -8,12 +8,14 @@ import reflex as rx
 from inventory_system.logging.logging import setup_loguru
 
 from . import styles
+from .backend.database import configure_engine_pool
 from .logging.audit_setup import initialize_audit_system
 from .pages import *
 
 # Set the environment variable
 os.environ["REFLEX_UPLOADED_FILES_DIR"] = "assets/uploads"
 setup_loguru()
+configure_engine_pool()
 initialize_audit_system()
 # Create the app.
 app = rx.App(
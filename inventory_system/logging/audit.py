@@ -7,7 +7,6 @@ import reflex as rx
 import reflex_local_auth
 from sqlalchemy import event, inspect
 from sqlalchemy.orm import Mapper
-from sqlmodel import select
 
 from inventory_system.logging.logging import audit_logger
 from inventory_system.models.audit import AuditTrail, OperationType
@@ -45,11 +44,7 @@ def get_username_by_user_id(user_id):
         return None
     try:
         with rx.session() as session:
-            user = session.exec(
-                select(reflex_local_auth.LocalUser).where(
-                    reflex_local_auth.LocalUser.id == user_id
-                )
-            ).one_or_none()
+            user = session.get(reflex_local_auth.LocalUser, user_id)
             return user.username if user else None
     except Exception:
         return None
@@ -2,6 +2,7 @@
 
 import threading
 import uuid
+from contextvars import ContextVar
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set
 
@@ -80,8 +81,16 @@ class EnhancedAuditEventListener:
 
     def __init__(self):
         self._tracked_models: Set[type] = set()
-        self._context_stack = []
-        self._bulk_context_stack = []
+        # Per task (and per asyncio.to_thread worker, which copies the
+        # caller's context), so concurrent events never see each other's
+        # context. Stacks are tuples because a ContextVar value is shared
+        # by reference with every copied context.
+        self._context_stack: ContextVar[tuple] = ContextVar(
+            "audit_context_stack", default=()
+        )
+        self._bulk_context_stack: ContextVar[tuple] = ContextVar(
+            "audit_bulk_context_stack", default=()
+        )
         self._pending_audits: List[Dict[str, Any]] = []
         self._pending_bulk_audits: List[BulkAuditContext] = []
         self._lock = threading.Lock()
@@ -93,29 +102,41 @@ class EnhancedAuditEventListener:
             event.listen(model_class, "after_update", self._after_update)
             event.listen(model_class, "after_delete", self._after_delete)
 
+    def unregister_model(self, model_class: type) -> None:
+        if model_class in self._tracked_models:
+            self._tracked_models.discard(model_class)
+            event.remove(model_class, "after_insert", self._after_insert)
+            event.remove(model_class, "after_update", self._after_update)
+            event.remove(model_class, "after_delete", self._after_delete)
+
     def set_audit_context(self, context: Dict[str, Any]) -> None:
-        self._context_stack.append(context)
+        self._context_stack.set(self._context_stack.get() + (context,))
 
     def clear_audit_context(self) -> None:
-        if self._context_stack:
-            self._context_stack.pop()
+        stack = self._context_stack.get()
+        if stack:
+            self._context_stack.set(stack[:-1])
 
     def get_current_context(self) -> Dict[str, Any]:
-        return self._context_stack[-1] if self._context_stack else {}
+        stack = self._context_stack.get()
+        return stack[-1] if stack else {}
 
     def set_bulk_context(self, bulk_context: BulkAuditContext) -> None:
         """Set bulk operation context."""
-        self._bulk_context_stack.append(bulk_context)
+        self._bulk_context_stack.set(self._bulk_context_stack.get() + (bulk_context,))
 
     def clear_bulk_context(self) -> BulkAuditContext:
         """Clear and return the current bulk context."""
-        if self._bulk_context_stack:
-            return self._bulk_context_stack.pop()
+        stack = self._bulk_context_stack.get()
+        if stack:
+            self._bulk_context_stack.set(stack[:-1])
+            return stack[-1]
         return None
 
     def get_current_bulk_context(self) -> Optional[BulkAuditContext]:
         """Get current bulk context if any."""
-        return self._bulk_context_stack[-1] if self._bulk_context_stack else None
+        stack = self._bulk_context_stack.get()
+        return stack[-1] if stack else None
 
     def _get_model_identifier(self, instance) -> tuple[str, Optional[str]]:
         entity_type = instance.__class__.__name__.lower()
@@ -429,6 +450,33 @@ class EnhancedAuditEventListener:
 enhanced_audit_listener = EnhancedAuditEventListener()
 
 
+def _request_context(auth_state: Optional[AuthState]) -> Dict[str, Any]:
+    """Acting user and request details for an audit context.
+
+    Each computed var and router attribute is read once, since every read of
+    a Reflex var goes back through its descriptor.
+    """
+    if auth_state is None:
+        return {
+            "user_id": None,
+            "username": "system",
+            "ip_address": None,
+            "session_id": None,
+            "request_path": None,
+            "user_agent": None,
+        }
+    ready = auth_state.is_authenticated_and_ready
+    router = auth_state.router
+    return {
+        "user_id": auth_state.user_id if ready else None,
+        "username": auth_state.username if ready else "system",
+        "ip_address": router.session.client_ip,
+        "session_id": getattr(auth_state, "session_id", None),
+        "request_path": getattr(router.page, "path", None),
+        "user_agent": getattr(router.session, "user_agent", None),
+    }
+
+
 class AsyncAuditContextManager:
     """Async context manager for setting audit context with AuthState integration."""
 
@@ -449,26 +497,8 @@ class AsyncAuditContextManager:
     async def __aenter__(self):
         auth_state = await self.state.get_state(AuthState) if self.state else None
         if auth_state:
-            self.context.setdefault(
-                "user_id",
-                auth_state.user_id if auth_state.is_authenticated_and_ready else None,
-            )
-            self.context.setdefault(
-                "username",
-                auth_state.username
-                if auth_state.is_authenticated_and_ready
-                else "system",
-            )
-            self.context.setdefault("ip_address", auth_state.router.session.client_ip)
-            self.context.setdefault(
-                "session_id", getattr(auth_state, "session_id", None)
-            )
-            self.context.setdefault(
-                "request_path", getattr(auth_state.router.page, "path", None)
-            )
-            self.context.setdefault(
-                "user_agent", getattr(auth_state.router.session, "user_agent", None)
-            )
+            for key, value in _request_context(auth_state).items():
+                self.context.setdefault(key, value)
         enhanced_audit_listener.set_audit_context(self.context)
         return self
 
@@ -523,22 +553,7 @@ class AsyncBulkAuditContextManager:
         # Get auth context
         auth_state = await self.state.get_state(AuthState) if self.state else None
         context = {
-            "user_id": auth_state.user_id
-            if auth_state and auth_state.is_authenticated_and_ready
-            else None,
-            "username": auth_state.username
-            if auth_state and auth_state.is_authenticated_and_ready
-            else "system",
-            "ip_address": auth_state.router.session.client_ip if auth_state else None,
-            "session_id": getattr(auth_state, "session_id", None)
-            if auth_state
-            else None,
-            "request_path": getattr(auth_state.router.page, "path", None)
-            if auth_state
-            else None,
-            "user_agent": getattr(auth_state.router.session, "user_agent", None)
-            if auth_state
-            else None,
+            **_request_context(auth_state),
             **self.additional_context,
         }
 
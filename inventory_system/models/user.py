@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 import reflex as rx
-from sqlalchemy import Column, Integer
+from sqlalchemy import Column, Index, Integer, exists, literal
 from sqlalchemy.orm import selectinload
 from sqlmodel import Field, Relationship, Session, select
 
@@ -85,9 +85,7 @@ class Permission(rx.Model, table=True):
             if not permission:
                 raise ValueError(f"Permission with id={self.id} not found")
             if name and name != self.name:
-                if session.exec(
-                    select(Permission).where(Permission.name == name)
-                ).one_or_none():
+                if session.exec(select(exists().where(Permission.name == name))).one():
                     raise ValueError(f"Permission name '{name}' already exists")
                 self.name = name
             if description is not None:
@@ -122,9 +120,7 @@ class Permission(rx.Model, table=True):
         session: Session,
     ) -> "Permission":
         try:
-            if session.exec(
-                select(Permission).where(Permission.name == name)
-            ).one_or_none():
+            if session.exec(select(exists().where(Permission.name == name))).one():
                 raise ValueError(f"Permission '{name}' already exists")
             permission = Permission(
                 name=name, description=description, category=category
@@ -259,7 +255,7 @@ class Role(rx.Model, table=True):
                     f"Role with id={self.id} not found or version mismatch"
                 )
             if name and name != self.name:
-                if session.exec(select(Role).where(Role.name == name)).one_or_none():
+                if session.exec(select(exists().where(Role.name == name))).one():
                     raise ValueError(f"Role name '{name}' already exists")
                 self.name = name
             if description is not None:
@@ -284,7 +280,7 @@ class Role(rx.Model, table=True):
         cls, name: str, description: Optional[str], session: Session
     ) -> "Role":
         try:
-            if session.exec(select(Role).where(Role.name == name)).one_or_none():
+            if session.exec(select(exists().where(Role.name == name))).one():
                 raise ValueError(f"Role '{name}' already exists")
             role = Role(name=name, description=description)
             session.add(role)
@@ -457,6 +453,9 @@ class Role(rx.Model, table=True):
 class UserInfo(rx.Model, table=True):
     """User information model linked to LocalUser in a one-to-one relationship."""
 
+    # Lets keyset pagination sorted by email seek instead of scan
+    __table_args__ = (Index("ix_userinfo_email_user_id", "email", "user_id"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     email: str = Field(index=True)
     user_id: int = Field(
@@ -497,19 +496,22 @@ class UserInfo(rx.Model, table=True):
                 raise ValueError(
                     f"UserInfo with id={self.id} not found or version mismatch"
                 )
-            roles = session.exec(
-                select(Role).where(Role.name.in_(role_names), Role.is_active)
-            ).all()
-            if len(roles) != len(role_names):
-                missing = set(role_names) - {role.name for role in roles}
-                raise ValueError(f"Roles not found or inactive: {missing}")
             session.exec(UserRole.__table__.delete().where(UserRole.user_id == self.id))
-            # Bulk insert new roles
-            if roles:
-                user_roles = [
-                    {"user_id": self.id, "role_id": role.id} for role in roles
-                ]
-                session.exec(UserRole.__table__.insert().values(user_roles))
+            # Resolve role names and insert the links in one INSERT ... SELECT
+            inserted = session.exec(
+                UserRole.__table__.insert().from_select(
+                    ["user_id", "role_id"],
+                    select(literal(self.id), Role.id).where(
+                        Role.name.in_(role_names), Role.is_active
+                    ),
+                )
+            ).rowcount
+            if inserted != len(role_names):
+                found = session.exec(
+                    select(Role.name).where(Role.name.in_(role_names), Role.is_active)
+                ).all()
+                missing = set(role_names) - set(found)
+                raise ValueError(f"Roles not found or inactive: {missing}")
             self.version += 1  # Increment version for optimistic locking
             self.update_timestamp()
             session.add(self)
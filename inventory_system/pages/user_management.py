@@ -218,6 +218,19 @@ def _show_user(user: rx.Var, index: int) -> rx.Component:
     bg_color = rx.cond(index % 2 == 0, rx.color("gray", 1), rx.color("accent", 2))
     hover_color = rx.cond(index % 2 == 0, rx.color("gray", 3), rx.color("accent", 3))
     return rx.table.row(
+        rx.table.cell(
+            rx.cond(
+                AuthState.permissions.contains("delete_user"),
+                rx.checkbox(
+                    checked=UserManagementState.users_to_delete.contains(user["id"]),
+                    on_change=lambda _: UserManagementState.toggle_delete_selection(
+                        user["id"]
+                    ),
+                    aria_label="Select user for deletion",
+                ),
+                None,
+            )
+        ),
         rx.table.row_header_cell(user["username"]),
         rx.table.cell(user["email"]),
         rx.table.cell(
@@ -350,6 +363,64 @@ def _show_user(user: rx.Var, index: int) -> rx.Component:
     )
 
 
+def _bulk_delete_dialog() -> rx.Component:
+    """Button and confirmation dialog for deleting all ticked users at once."""
+    return rx.cond(
+        AuthState.permissions.contains("delete_user")
+        & (UserManagementState.users_to_delete.length() > 0),
+        rx.alert_dialog.root(
+            rx.alert_dialog.trigger(
+                rx.button(
+                    rx.icon("trash-2"),
+                    f"Delete selected ({UserManagementState.users_to_delete.length()})",
+                    color_scheme="red",
+                    size="3",
+                    on_click=UserManagementState.confirm_delete_selected,
+                ),
+            ),
+            rx.alert_dialog.content(
+                rx.vstack(
+                    rx.alert_dialog.title("Delete Users"),
+                    rx.alert_dialog.description(
+                        f"Are you sure you want to delete "
+                        f"{UserManagementState.users_to_delete.length()} user(s)? "
+                        "This action cannot be undone.",
+                        size="2",
+                    ),
+                    rx.flex(
+                        rx.alert_dialog.cancel(
+                            rx.button(
+                                "Cancel",
+                                variant="soft",
+                                color_scheme="gray",
+                                size="3",
+                                on_click=UserManagementState.cancel_bulk_delete,
+                            )
+                        ),
+                        rx.alert_dialog.action(
+                            rx.button(
+                                "Delete",
+                                color_scheme="red",
+                                size="3",
+                                on_click=UserManagementState.delete_selected_users,
+                            )
+                        ),
+                        spacing="3",
+                        width="100%",
+                        justify="end",
+                    ),
+                    spacing="4",
+                    width="100%",
+                    padding="16px",
+                ),
+                style={"max_width": "500px", "width": "100%"},
+            ),
+            open=UserManagementState.show_bulk_delete_dialog,
+        ),
+        None,
+    )
+
+
 # Update the _user_card function in user_management.py
 def _user_card(user: rx.Var) -> rx.Component:
     """Creates a compact card for each user on mobile/tablet, styled consistently with the app's theme."""
@@ -530,6 +601,7 @@ def _pagination_view() -> rx.Component:
 )
 @reflex_local_auth.require_login
 def user_management() -> rx.Component:
+    clear_search = UserManagementState.set_search_value("")
     return rx.box(
         rx.hstack(
             rx.heading("User Management", size="3"),
@@ -610,6 +682,7 @@ def user_management() -> rx.Component:
                                             on_click=UserManagementState.toggle_sort,
                                         ),
                                     ),
+                                    _bulk_delete_dialog(),
                                     rx.select(
                                         ["username", "email"],
                                         placeholder="Sort By: Username",
@@ -622,9 +695,7 @@ def user_management() -> rx.Component:
                                             rx.icon("x"),
                                             justify="end",
                                             cursor="pointer",
-                                            on_click=UserManagementState.setvar(
-                                                "search_value", ""
-                                            ),
+                                            on_click=clear_search,
                                             display=rx.cond(
                                                 UserManagementState.search_value,
                                                 "flex",
@@ -657,6 +728,7 @@ def user_management() -> rx.Component:
                             rx.table.root(
                                 rx.table.header(
                                     rx.table.row(
+                                        rx.table.column_header_cell(""),
                                         _header_cell("Username", "user"),
                                         _header_cell("Email", "mail"),
                                         _header_cell("Roles", "shield"),
@@ -688,9 +760,7 @@ def user_management() -> rx.Component:
                                         rx.icon("x"),
                                         justify="end",
                                         cursor="pointer",
-                                        on_click=UserManagementState.setvar(
-                                            "search_value", ""
-                                        ),
+                                        on_click=clear_search,
                                         display=rx.cond(
                                             UserManagementState.search_value,
                                             "flex",
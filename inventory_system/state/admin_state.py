@@ -2,8 +2,9 @@ import reflex as rx
 import reflex_local_auth
 from sqlmodel import select
 
-from inventory_system.models.user import Supplier, UserInfo
+from inventory_system.models.user import Supplier
 from inventory_system.state.auth import AuthState
+from inventory_system.state.user_data_service import UserDataService
 
 
 class AdminState(AuthState):
@@ -32,25 +33,17 @@ class AdminState(AuthState):
                 current_user_id = (
                     self.user_id if self.is_authenticated_and_ready else None
                 )
-                stmt_users = (
-                    select(UserInfo, reflex_local_auth.LocalUser.username)
-                    .join(
-                        reflex_local_auth.LocalUser,
-                        UserInfo.user_id == reflex_local_auth.LocalUser.id,
-                    )
-                    .where(UserInfo.user_id != current_user_id)
-                )
-                user_results = session.exec(stmt_users).all()
+                # Roles come back batched with the users (no per-row lazy load)
                 self.users_data = [
                     {
-                        "username": username,
-                        "id": user_info.user_id,
-                        "email": user_info.email,
-                        "role": user_info.get_roles()[0]
-                        if user_info.get_roles()
-                        else "none",  # Handle multiple roles in Step 6
+                        "username": user["username"],
+                        "id": user["id"],
+                        "email": user["email"],
+                        "role": user["roles"][0],  # "none" when unassigned
                     }
-                    for user_info, username in user_results
+                    for user in UserDataService.load_users_data(
+                        exclude_user_id=current_user_id
+                    )
                 ]
 
                 self.user_stats = {
@@ -1,9 +1,10 @@
 import contextlib
-from typing import List, Optional
+from typing import List, Optional, Set
 
 import reflex as rx
 import reflex_local_auth
 from email_validator import validate_email
+from sqlalchemy import exists
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
@@ -14,6 +15,7 @@ from inventory_system.logging.audit import (
 )
 from inventory_system.logging.logging import audit_logger
 from inventory_system.models.user import Role, UserInfo
+from inventory_system.state.user_data_service import UserDataService
 
 
 class AuthState(reflex_local_auth.LocalAuthState):
@@ -46,6 +48,8 @@ class AuthState(reflex_local_auth.LocalAuthState):
     user_email: str = ""
     roles: List[str] = []
     permissions: List[str] = []
+    # Backend-only set mirror of permissions for O(1) has_permission checks
+    _permission_set: Set[str] = set()
     auth_processing: bool = False
     auth_error_message: str = ""
     auth_profile_picture: str | None = None
@@ -92,7 +96,8 @@ class AuthState(reflex_local_auth.LocalAuthState):
         database queries. Updates state variables optimistically and provides UI
         feedback via rx.toast. Uses SELECT FOR UPDATE for concurrency safety.
         """
-        if not self.is_authenticated or not self.authenticated_user:
+        auth_user = self.authenticated_user  # Read the cached var once
+        if not self.is_authenticated or not auth_user:
             self.reset_state()
             audit_logger.warning(
                 "load_user_data_skipped",
@@ -107,7 +112,7 @@ class AuthState(reflex_local_auth.LocalAuthState):
             with rx.session() as session:
                 user_info = session.exec(
                     select(UserInfo)
-                    .where(UserInfo.user_id == self.authenticated_user.id)
+                    .where(UserInfo.user_id == auth_user.id)
                     .options(
                         selectinload(UserInfo.roles).selectinload(Role.permissions)
                     )
@@ -116,7 +121,7 @@ class AuthState(reflex_local_auth.LocalAuthState):
                 if not user_info:
                     audit_logger.error(
                         "load_user_data_failed",
-                        user_id=self.authenticated_user.id,
+                        user_id=auth_user.id,
                         error="UserInfo not found",
                     )
                     self.reset_state()
@@ -128,7 +133,7 @@ class AuthState(reflex_local_auth.LocalAuthState):
                 self.user_id = user_info.user_id
                 self.user_email = user_info.email
                 self.roles = user_info.get_roles()
-                self.permissions = user_info.get_permissions(session=session)
+                self._set_permissions(user_info.get_permissions(session=session))
 
                 audit_logger.info(
                     "load_user_data_success",
@@ -140,7 +145,7 @@ class AuthState(reflex_local_auth.LocalAuthState):
         except Exception as e:
             audit_logger.error(
                 "load_user_data_failed",
-                user_id=self.authenticated_user.id if self.authenticated_user else None,
+                user_id=auth_user.id if auth_user else None,
                 error=str(e),
             )
             self.auth_error_message = str(e)
@@ -173,13 +178,15 @@ class AuthState(reflex_local_auth.LocalAuthState):
             with self.audit_context():
                 with rx.session() as session:
                     validate_email(email, check_deliverability=False)
-                    existing_user = session.exec(
-                        select(UserInfo).where(
-                            UserInfo.email == email,
-                            UserInfo.user_id != self.user_id,
+                    email_taken = session.exec(
+                        select(
+                            exists().where(
+                                UserInfo.email == email,
+                                UserInfo.user_id != self.user_id,
+                            )
                         )
-                    ).one_or_none()
-                    if existing_user:
+                    ).one()
+                    if email_taken:
                         raise ValueError("This email is already in use by another user")
 
                     user_info = session.exec(
@@ -198,17 +205,14 @@ class AuthState(reflex_local_auth.LocalAuthState):
                     session.add(user_info)
 
                     # Update LocalUser email
-                    local_user = session.exec(
-                        select(reflex_local_auth.LocalUser).where(
-                            reflex_local_auth.LocalUser.id == self.user_id
-                        )
-                    ).one_or_none()
+                    local_user = session.get(reflex_local_auth.LocalUser, self.user_id)
                     if local_user:
                         local_user.email = email
                         session.add(local_user)
 
                     session.commit()
                     session.refresh(user_info)
+                    UserDataService.invalidate_cache()
 
                     audit_logger.info(
                         "update_user_info_success",
@@ -263,8 +267,9 @@ class AuthState(reflex_local_auth.LocalAuthState):
                     user_info.set_roles(role_names, session)
                     session.commit()
                     session.refresh(user_info)
+                    UserDataService.invalidate_cache()
 
-                    self.permissions = user_info.get_permissions(session=session)
+                    self._set_permissions(user_info.get_permissions(session=session))
 
                     audit_logger.info(
                         "roles_updated",
@@ -291,12 +296,10 @@ class AuthState(reflex_local_auth.LocalAuthState):
         self.auth_processing = True
         yield
 
+        auth_user = None
         try:
-            if (
-                not self.is_authenticated
-                or not self.authenticated_user
-                or not self.auth_token
-            ):
+            auth_user = self.authenticated_user  # Read the cached var once
+            if not self.is_authenticated or not auth_user or not self.auth_token:
                 audit_logger.warning(
                     "validate_session_failed",
                     user_id=self.user_id,
@@ -309,16 +312,12 @@ class AuthState(reflex_local_auth.LocalAuthState):
                 return
 
             with rx.session() as session:
-                local_user = session.exec(
-                    select(reflex_local_auth.LocalUser).where(
-                        reflex_local_auth.LocalUser.id == self.authenticated_user.id
-                    )
-                ).one_or_none()
+                local_user = session.get(reflex_local_auth.LocalUser, auth_user.id)
 
                 if not local_user:
                     audit_logger.error(
                         "validate_session_failed",
-                        user_id=self.authenticated_user.id,
+                        user_id=auth_user.id,
                         error="LocalUser not found",
                     )
                     self.do_logout()
@@ -329,13 +328,13 @@ class AuthState(reflex_local_auth.LocalAuthState):
 
                 audit_logger.info(
                     "validate_session_success",
-                    user_id=self.authenticated_user.id,
+                    user_id=auth_user.id,
                 )
                 yield rx.toast.success("Session validated")
         except Exception as e:
             audit_logger.error(
                 "validate_session_failed",
-                user_id=self.authenticated_user.id if self.authenticated_user else None,
+                user_id=auth_user.id if auth_user else None,
                 error=str(e),
             )
             self.auth_error_message = str(e)
@@ -346,15 +345,20 @@ class AuthState(reflex_local_auth.LocalAuthState):
         finally:
             self.auth_processing = False
 
+    def _set_permissions(self, permissions: List[str]) -> None:
+        """Replace the user's permissions, keeping the lookup set in sync."""
+        self.permissions = permissions
+        self._permission_set = set(permissions)
+
     def has_permission(self, permission_name: str) -> bool:
         """Check if the user has a specific permission."""
-        return permission_name in self.permissions
+        return permission_name in self._permission_set
 
     def reset_state(self):
         """Reset state variables to their default values."""
         self.user_id = None
         self.user_email = ""
         self.roles = []
-        self.permissions = []
+        self._set_permissions([])
         self.auth_error_message = ""
         self.auth_profile_picture = None
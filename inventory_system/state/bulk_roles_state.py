@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Set
 
 import reflex as rx
+from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
 from inventory_system.logging.audit_listeners import with_async_bulk_audit_context
@@ -87,46 +88,53 @@ class BulkOperationsState(AuthState):
     def selected_role_count(self) -> int:
         return len(self.selected_role_ids)
 
-    # Added computed var for filtered users based on search and sort
-    @rx.var
-    def filtered_users(self) -> List[Dict[str, Any]]:
-        users_data = self._users_data
-
+    # Backend-only: re-sorted only when the data or sort order changes
+    @rx.var(cache=True)
+    def _sorted_users(self) -> List[Dict[str, Any]]:
         return UserDataService.filter_users(
-            users_data=users_data,
-            search_value=self.user_search_value,
+            users_data=self._users_data,
             sort_value=self.user_sort_value,
             sort_reverse=self.user_sort_reverse,
         )
 
+    # Backend-only: the full match list is never serialized to the client
+    @rx.var
+    def _filtered_users(self) -> List[Dict[str, Any]]:
+        # Filtering keeps order, so keystrokes never trigger a re-sort
+        return UserDataService.match_users(self._sorted_users, self.user_search_value)
+
     # Added computed var for current page of users (desktop)
     @rx.var
     def current_users_page(self) -> List[Dict[str, Any]]:
         start = (self.user_page_number - 1) * self.user_page_size
         end = start + self.user_page_size
-        return self.filtered_users[start:end]
+        return [UserDataService.public_row(u) for u in self._filtered_users[start:end]]
 
     # Added computed var for total pages of users
     @rx.var
     def users_total_pages(self) -> int:
         return max(
             1,
-            (len(self.filtered_users) + self.user_page_size - 1) // self.user_page_size,
+            (len(self._filtered_users) + self.user_page_size - 1)
+            // self.user_page_size,
         )
 
     # Added computed var for mobile displayed users
     @rx.var
     def mobile_displayed_users(self) -> List[Dict[str, Any]]:
-        return self.filtered_users[: self.user_mobile_displayed_count]
+        return [
+            UserDataService.public_row(u)
+            for u in self._filtered_users[: self.user_mobile_displayed_count]
+        ]
 
     # Added computed var to check if more users are available on mobile
     @rx.var
     def has_more_users(self) -> bool:
-        return len(self.filtered_users) > self.user_mobile_displayed_count
+        return len(self._filtered_users) > self.user_mobile_displayed_count
 
-    # Added computed var for filtered roles based on search and sort
+    # Backend-only: the full role list is never serialized to the client
     @rx.var
-    def filtered_roles(self) -> List[Dict[str, Any]]:
+    def _filtered_roles(self) -> List[Dict[str, Any]]:
         roles_data = self._roles_data
 
         return RoleDataService.filter_roles(
@@ -141,25 +149,26 @@ class BulkOperationsState(AuthState):
     def current_roles_page(self) -> List[Dict[str, Any]]:
         start = (self.role_page_number - 1) * self.role_page_size
         end = start + self.role_page_size
-        return self.filtered_roles[start:end]
+        return self._filtered_roles[start:end]
 
     # Added computed var for total pages of roles
     @rx.var
     def roles_total_pages(self) -> int:
         return max(
             1,
-            (len(self.filtered_roles) + self.role_page_size - 1) // self.role_page_size,
+            (len(self._filtered_roles) + self.role_page_size - 1)
+            // self.role_page_size,
         )
 
     # Added computed var for mobile displayed roles
     @rx.var
     def mobile_displayed_roles(self) -> List[Dict[str, Any]]:
-        return self.filtered_roles[: self.role_mobile_displayed_count]
+        return self._filtered_roles[: self.role_mobile_displayed_count]
 
     # Added computed var to check if more roles are available on mobile
     @rx.var
     def has_more_roles(self) -> bool:
-        return len(self.filtered_roles) > self.role_mobile_displayed_count
+        return len(self._filtered_roles) > self.role_mobile_displayed_count
 
     @rx.event
     def on_mount(self):
@@ -453,6 +462,7 @@ class BulkOperationsState(AuthState):
                         operation=self.bulk_operation_type,
                     )
                     session.commit()
+                    UserDataService.invalidate_cache()
 
                     # Set operation summary in bulk context
                     bulk_context.set_summary(
@@ -646,7 +656,9 @@ class BulkOperationsState(AuthState):
         """Export users to CSV."""
         try:
             with rx.session() as session:
-                users = session.exec(select(UserInfo)).all()
+                users = session.exec(
+                    select(UserInfo).options(selectinload(UserInfo.roles))
+                ).all()
                 csv_data = []
                 for user in users:
                     csv_data.append(
@@ -17,6 +17,17 @@ class ProfileState(AuthState):
     is_updating_email: bool = False  # Loading state for email update
     is_updating_password: bool = False  # Loading state for password update
 
+    def _audit_fields(self) -> dict:
+        """Acting user and request details attached to every profile audit event."""
+        user = self.authenticated_user
+        return {
+            "user_id": user.id,
+            "username": user.username,
+            "ip_address": self.router.session.client_ip,
+            "method": "POST",
+            "url": self.router.page.raw_path,
+        }
+
     def _handle_error(self, error_type: str, error_message: str):
         """Handle errors with logging and UI feedback."""
         if error_type == "email":
@@ -25,11 +36,7 @@ class ProfileState(AuthState):
             self.password_error = error_message
         audit_logger.error(
             f"{error_type}_update_failed",
-            user_id=self.authenticated_user.id,
-            username=self.authenticated_user.username,
-            ip_address=self.router.session.client_ip,
-            method="POST",
-            url=self.router.page.raw_path,
+            **self._audit_fields(),
             error=error_message,
         )
         return rx.toast.error(error_message, position="top-center")
@@ -64,14 +71,9 @@ class ProfileState(AuthState):
 
         self.is_updating_password = True
         try:
-            audit_logger.info(
-                "password_change_request",
-                user_id=self.authenticated_user.id,
-                username=self.authenticated_user.username,
-                ip_address=self.router.session.client_ip,
-                method="POST",
-                url=self.router.page.raw_path,
-            )
+            user_id = self.authenticated_user.id
+            audit_fields = self._audit_fields()
+            audit_logger.info("password_change_request", **audit_fields)
 
             current_password = form_data["current_password"]
             new_password = form_data["new_password"]
@@ -84,7 +86,7 @@ class ProfileState(AuthState):
             with rx.session() as session:
                 user = session.exec(
                     select(reflex_local_auth.LocalUser).where(
-                        reflex_local_auth.LocalUser.id == self.authenticated_user.id
+                        reflex_local_auth.LocalUser.id == user_id
                     )
                 ).one()
 
@@ -102,14 +104,7 @@ class ProfileState(AuthState):
                 session.refresh(user)
 
             self.password_error = ""
-            audit_logger.info(
-                "password_change_success",
-                user_id=self.authenticated_user.id,
-                username=self.authenticated_user.username,
-                ip_address=self.router.session.client_ip,
-                method="POST",
-                url=self.router.page.raw_path,
-            )
+            audit_logger.info("password_change_success", **audit_fields)
             yield rx.toast.success(
                 "Password updated successfully", position="top-center"
             )
@@ -120,11 +115,7 @@ class ProfileState(AuthState):
         self.notifications = not self.notifications
         audit_logger.info(
             "notification_settings_updated",
-            user_id=self.authenticated_user.id,
-            username=self.authenticated_user.username,
-            ip_address=self.router.session.client_ip,
-            method="POST",
-            url=self.router.page.raw_path,
+            **self._audit_fields(),
             notifications_enabled=self.notifications,
         )
 
@@ -150,11 +141,7 @@ class ProfileState(AuthState):
         try:
             audit_logger.info(
                 "profile_update_request",
-                user_id=self.authenticated_user.id,
-                username=self.authenticated_user.username,
-                ip_address=self.router.session.client_ip,
-                method="POST",
-                url=self.router.page.raw_path,
+                **self._audit_fields(),
                 data=form_data,
             )
             email = form_data["email"]
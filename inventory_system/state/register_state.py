@@ -2,10 +2,12 @@ import json
 import os
 import re
 import uuid
+from typing import Dict, Optional, Set, Tuple
 
 import reflex as rx
 import reflex_local_auth
 from email_validator import EmailNotValidError, validate_email
+from sqlalchemy import exists
 from sqlmodel import select
 
 from inventory_system import routes
@@ -16,6 +18,7 @@ from inventory_system.logging.logging import audit_logger
 from inventory_system.models.audit import OperationType
 from inventory_system.models.user import Role, UserInfo
 from inventory_system.state.auth import AuthState
+from inventory_system.state.user_data_service import UserDataService
 from inventory_system.state.user_mgmt_state import UserManagementState
 
 from ..constants import DEFAULT_PROFILE_PICTURE
@@ -34,6 +37,28 @@ def load_user_data():
         return []
 
 
+# (mtime, {ID: lowercased emails}) for USER_DATA_FILE; rebuilt when it changes.
+_user_lookup_cache: Optional[Tuple[float, Dict[str, Set[str]]]] = None
+
+
+def load_user_lookup() -> Dict[str, Set[str]]:
+    """Index user_data.json by ID, re-reading the file only when it changes.
+
+    An ID can appear more than once, so each maps to a set of emails.
+    """
+    global _user_lookup_cache
+    try:
+        mtime = os.path.getmtime(USER_DATA_FILE)
+    except OSError:
+        return {}
+    if _user_lookup_cache is None or _user_lookup_cache[0] != mtime:
+        lookup: Dict[str, Set[str]] = {}
+        for user in load_user_data():
+            lookup.setdefault(str(user["ID"]), set()).add(user["Email"].lower())
+        _user_lookup_cache = (mtime, lookup)
+    return _user_lookup_cache[1]
+
+
 class CustomRegisterState(reflex_local_auth.RegistrationState):
     registration_error: str = ""
     is_submitting: bool = False
@@ -45,16 +70,9 @@ class CustomRegisterState(reflex_local_auth.RegistrationState):
 
     def validate_user(self, form_data):
         """Validate user ID and email against user_data.json."""
-        user_data = load_user_data()
         user_id = form_data.get("id")
         email = form_data.get("email")
-        for user in user_data:
-            if (
-                str(user["ID"]) == str(user_id)
-                and user["Email"].lower() == email.lower()
-            ):
-                return True
-        return False
+        return email.lower() in load_user_lookup().get(str(user_id), ())
 
     def _validate_fields(
         self, username: str, password: str, confirm_password: str, email: str
@@ -75,18 +93,17 @@ class CustomRegisterState(reflex_local_auth.RegistrationState):
             )
             return False
         with rx.session() as session:
+            # EXISTS probes return a single boolean instead of hydrating rows
             if session.exec(
-                select(reflex_local_auth.LocalUser).where(
-                    reflex_local_auth.LocalUser.username == username
-                )
-            ).one_or_none():
+                select(exists().where(reflex_local_auth.LocalUser.username == username))
+            ).one():
                 self.registration_error = f"Username {username} is already taken"
                 return False
 
             # Check if email is already taken
             if session.exec(
-                select(UserInfo).where(UserInfo.email == email.lower())
-            ).one_or_none():
+                select(exists().where(UserInfo.email == email.lower()))
+            ).one():
                 self.registration_error = f"Email {email} is already registered"
                 return False
 
@@ -180,8 +197,8 @@ class CustomRegisterState(reflex_local_auth.RegistrationState):
 
                     # Check for existing UserInfo (safety check)
                     existing_info = session.exec(
-                        select(UserInfo).where(UserInfo.user_id == user_id)
-                    ).one_or_none()
+                        select(exists().where(UserInfo.user_id == user_id))
+                    ).one()
                     if existing_info:
                         raise RuntimeError("User profile already exists.")
 
@@ -215,10 +232,11 @@ class CustomRegisterState(reflex_local_auth.RegistrationState):
                     # Commit everything together - all or nothing
                     session.commit()
                     session.refresh(user_info)
+                    UserDataService.invalidate_cache()
 
                     # Refresh user management state if needed
                     user_mgmt_state = await self.get_state(UserManagementState)
-                    user_mgmt_state.check_auth_and_load()
+                    user_mgmt_state.check_auth_and_load(force=True)
 
                     # Log additional success details (the database operations are automatically audited)
                     audit_logger.info(
@@ -385,7 +403,7 @@ class CustomRegisterState(reflex_local_auth.RegistrationState):
 
                 # Refresh user management state
                 user_mgmt_state = await self.get_state(UserManagementState)
-                user_mgmt_state.check_auth_and_load()
+                user_mgmt_state.check_auth_and_load(force=True)
 
         except ValueError as validation_error:
             yield rx.toast.error(str(validation_error))
@@ -1,5 +1,7 @@
 # role_data_service.py
-from typing import Any, Dict, List
+import time
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 
 import reflex as rx
 from sqlmodel import select
@@ -7,6 +9,12 @@ from sqlmodel import select
 from inventory_system.logging.logging import audit_logger
 from inventory_system.models.user import Role
 
+# Seconds the role name list is reused before hitting the database again.
+ROLE_NAMES_CACHE_TTL = 30.0
+
+# (loaded_at, sorted role names); None until first load or after invalidation.
+_role_names_cache: Optional[Tuple[float, List[str]]] = None
+
 
 class RoleDataService:
     """Shared service for loading role data across different states."""
@@ -40,6 +48,30 @@ class RoleDataService:
                 audit_logger.error("loading_roles_data_failed", error=str(e))
                 return []
 
+    @staticmethod
+    def load_role_names() -> List[str]:
+        """Return the sorted names of all roles, cached for ROLE_NAMES_CACHE_TTL.
+
+        Raises the underlying database error so callers can choose a fallback.
+        """
+        global _role_names_cache
+        if (
+            _role_names_cache
+            and time.monotonic() - _role_names_cache[0] < ROLE_NAMES_CACHE_TTL
+        ):
+            return list(_role_names_cache[1])
+
+        with rx.session() as session:
+            role_names = sorted(set(session.exec(select(Role.name)).all()))
+        _role_names_cache = (time.monotonic(), role_names)
+        return list(role_names)
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop the cached role names after roles are created, renamed or deleted."""
+        global _role_names_cache
+        _role_names_cache = None
+
     @staticmethod
     def filter_roles(
         roles_data: List[Dict[str, Any]],
@@ -59,4 +91,4 @@ class RoleDataService:
                 or (r["description"] and search_lower in r["description"].lower())
             ]
 
-        return sorted(data, key=lambda x: x[sort_value], reverse=sort_reverse)
+        return sorted(data, key=itemgetter(sort_value), reverse=sort_reverse)
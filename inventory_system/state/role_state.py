@@ -7,6 +7,8 @@ from inventory_system.logging.audit_listeners import with_async_audit_context
 from inventory_system.models.user import Permission, Role, RolePermission, UserRole
 from inventory_system.state.auth import AuthState
 from inventory_system.state.bulk_roles_state import BulkOperationsState
+from inventory_system.state.role_data_service import RoleDataService
+from inventory_system.state.user_data_service import UserDataService
 
 
 class RoleManagementState(rx.State):
@@ -238,6 +240,8 @@ class RoleManagementState(rx.State):
                         session=session,
                     )
                     session.commit()
+                    RoleDataService.invalidate_cache()
+                    UserDataService.invalidate_cache()
                     self.load_roles()
                     yield AuthState.load_user_data()
                     bulk_state = await self.get_state(BulkOperationsState)
@@ -279,6 +283,8 @@ class RoleManagementState(rx.State):
                             description=self.role_form_description,
                         )
                         session.commit()
+                        RoleDataService.invalidate_cache()
+                        UserDataService.invalidate_cache()
                         self.load_roles()
                         yield AuthState.load_user_data()
 
@@ -322,6 +328,8 @@ class RoleManagementState(rx.State):
                             return
                         Role.delete_role(name=role.name, session=session)
                         session.commit()
+                        RoleDataService.invalidate_cache()
+                        UserDataService.invalidate_cache()
                         self.load_roles()
                         yield AuthState.load_user_data()
                         bulk_state = await self.get_state(BulkOperationsState)
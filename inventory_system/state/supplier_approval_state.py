@@ -1,3 +1,4 @@
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
 import reflex as rx
@@ -9,12 +10,40 @@ from inventory_system.logging.audit_listeners import (
 )
 from inventory_system.models.user import Supplier, UserInfo
 from inventory_system.state.auth import AuthState
+from inventory_system.state.user_data_service import UserDataService
 
 from ..utils.register_supplier import register_supplier
 
 
+def _delete_supplier_account(session, user_info_id: int) -> Optional[int]:
+    """Delete a supplier's profile and login; returns the UserInfo id deleted.
+
+    Returns None if the profile no longer exists.
+    """
+    # Lock the profile and its login in one round trip
+    row = session.exec(
+        select(UserInfo, reflex_local_auth.LocalUser)
+        .join(
+            reflex_local_auth.LocalUser,
+            UserInfo.user_id == reflex_local_auth.LocalUser.id,
+        )
+        .where(UserInfo.id == user_info_id)
+        .with_for_update()
+    ).one_or_none()
+    if not row:
+        return None
+    user_info, local_user = row
+    deleted_id = user_info.id
+    session.delete(local_user)
+    session.flush()
+    session.delete(user_info)
+    return deleted_id
+
+
 class SupplierApprovalState(AuthState):
     users_data: List[Dict[str, Any]] = []
+    # Lowercased "name\x00email" per users_data row, in the same order
+    _search_keys: List[str] = []
     supplier_error_message: str = ""
     supplier_success_message: str = ""
     is_loading: bool = False
@@ -58,6 +87,9 @@ class SupplierApprovalState(AuthState):
                     }
                     for row in results
                 ]
+                self._search_keys = [
+                    f"{row.username}\x00{row.email}".lower() for row in results
+                ]
         finally:
             self.set_is_loading(False)
 
@@ -133,6 +165,7 @@ class SupplierApprovalState(AuthState):
                         supplier.status = "approved"
                         session.add(supplier)
                         session.commit()
+                        UserDataService.invalidate_cache()
 
                         yield await self.send_welcome_email(
                             supplier.contact_email,
@@ -219,22 +252,9 @@ class SupplierApprovalState(AuthState):
                     associated_user_id = None
 
                     if supplier.user_info_id:
-                        user_info = session.exec(
-                            select(UserInfo)
-                            .where(UserInfo.id == supplier.user_info_id)
-                            .with_for_update()
-                        ).one_or_none()
-                        if user_info:
-                            associated_user_id = user_info.id
-                            local_user = session.exec(
-                                select(reflex_local_auth.LocalUser).where(
-                                    reflex_local_auth.LocalUser.id == user_info.user_id
-                                )
-                            ).one_or_none()
-                            if local_user:
-                                session.delete(local_user)
-                                session.flush()
-                            session.delete(user_info)
+                        associated_user_id = _delete_supplier_account(
+                            session, supplier.user_info_id
+                        )
                         supplier.user_info_id = None
                         supplier.status = "revoked"
                         session.add(supplier)
@@ -243,6 +263,7 @@ class SupplierApprovalState(AuthState):
                         session.add(supplier)
 
                     session.commit()
+                    UserDataService.invalidate_cache()
                     self.setvar(
                         "supplier_success_message",
                         f"Supplier {target_supplier_company_name} "
@@ -314,26 +335,12 @@ class SupplierApprovalState(AuthState):
 
                 try:
                     if supplier.user_info_id:
-                        user_info = session.exec(
-                            select(UserInfo)
-                            .where(UserInfo.id == supplier.user_info_id)
-                            .with_for_update()
-                        ).one_or_none()
-                        if user_info:
-                            associated_user_id = user_info.id
-                            local_user = session.exec(
-                                select(reflex_local_auth.LocalUser)
-                                .where(
-                                    reflex_local_auth.LocalUser.id == user_info.user_id
-                                )
-                                .with_for_update()
-                            ).one_or_none()
-                            if local_user:
-                                session.delete(local_user)
-                                session.flush()
-                            session.delete(user_info)
+                        associated_user_id = _delete_supplier_account(
+                            session, supplier.user_info_id
+                        )
                     session.delete(supplier)
                     session.commit()
+                    UserDataService.invalidate_cache()
                     self.supplier_success_message = (
                         f"Supplier {target_supplier_company_name} deleted successfully."
                     )
@@ -364,25 +371,25 @@ class SupplierApprovalState(AuthState):
 
     @rx.var
     def total_pages(self) -> int:
-        return max(1, (len(self.filtered_users) + self.page_size - 1) // self.page_size)
+        return max(
+            1, (len(self._filtered_users) + self.page_size - 1) // self.page_size
+        )
 
+    # Backend-only: built once per search/sort change and never sent to the
+    # client; total_pages and has_more_suppliers only take its length.
     @rx.var
-    def filtered_users(self) -> List[Dict[str, Any]]:
+    def _filtered_users(self) -> List[Dict[str, Any]]:
         data = self.users_data
         if self.search_value:
-            data = [
-                u
-                for u in data
-                if self.search_value.lower() in u["username"].lower()
-                or self.search_value.lower() in u["email"].lower()
-            ]
-        return sorted(data, key=lambda x: x[self.sort_value], reverse=self.sort_reverse)
+            needle = self.search_value.lower()
+            data = [u for u, key in zip(data, self._search_keys) if needle in key]
+        return sorted(data, key=itemgetter(self.sort_value), reverse=self.sort_reverse)
 
     @rx.var
     def current_page(self) -> List[Dict[str, Any]]:
         start = (self.page_number - 1) * self.page_size
         end = start + self.page_size
-        return self.filtered_users[start:end]
+        return self._filtered_users[start:end]
 
     async def send_welcome_email(self, email: str, username: str, password: str):
         self.supplier_error_message = ""
@@ -491,12 +498,12 @@ class SupplierApprovalState(AuthState):
     @rx.var
     def mobile_displayed_suppliers(self) -> List[Dict[str, Any]]:
         """Computes the list of suppliers to display on mobile based on mobile_displayed_count."""
-        return self.filtered_users[: self.mobile_displayed_count]
+        return self._filtered_users[: self.mobile_displayed_count]
 
     @rx.var
     def has_more_suppliers(self) -> bool:
         """Determines if there are more suppliers to load on mobile."""
-        return len(self.filtered_users) > self.mobile_displayed_count
+        return len(self._filtered_users) > self.mobile_displayed_count
 
     # Add new method for mobile pagination
     def load_more(self):
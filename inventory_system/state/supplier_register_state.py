@@ -1,10 +1,11 @@
-# inventory_system/pages/supplier_register.py
+# inventory_system/state/supplier_register_state.py
+import asyncio
 import re
-import uuid
+import secrets
 
 import reflex as rx
 from email_validator import EmailNotValidError, validate_email
-from sqlmodel import select
+from sqlalchemy.exc import IntegrityError
 
 from inventory_system.logging.audit_listeners import (
     with_async_audit_context,
@@ -16,6 +17,28 @@ MAX_COMPANY_NAME_LENGTH = 100  # Example limit
 MAX_DESCRIPTION_LENGTH = 500  # Example limit
 
 
+def _insert_supplier(
+    company_name: str, description: str, contact_email: str, contact_phone: str
+) -> Supplier:
+    """Insert a pending supplier; raises IntegrityError on a duplicate."""
+    with rx.session() as session:
+        supplier = Supplier(
+            company_name=company_name,
+            description=description,
+            contact_email=contact_email,
+            contact_phone=contact_phone,
+            status="pending",
+        )
+        session.add(supplier)
+        try:
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+            raise
+        session.refresh(supplier)
+        return supplier
+
+
 class SupplierRegisterState(rx.State):
     company_name: str = ""
     description: str = ""
@@ -27,24 +50,41 @@ class SupplierRegisterState(rx.State):
 
     def set_company_name(self, value: str):
         self.company_name = value.strip()
-        self.clear_messages()
+        if self.success_message or self.error_message:
+            self.clear_messages()
 
     def set_description(self, value: str):
         self.description = value.strip()
-        self.clear_messages()
+        if self.success_message or self.error_message:
+            self.clear_messages()
 
     def set_contact_email(self, value: str):
         self.contact_email = value.strip()
-        self.clear_messages()
+        if self.success_message or self.error_message:
+            self.clear_messages()
 
     def set_contact_phone(self, value: str):
         self.contact_phone = value.strip()
-        self.clear_messages()
+        if self.success_message or self.error_message:
+            self.clear_messages()
 
     def clear_messages(self):
         self.success_message = ""
         self.error_message = ""
 
+    def _registration_failed(self, error: Exception, ip_address: str):
+        """Show the generic error and audit an unexpected registration failure."""
+        self.error_message = "An unexpected error occurred during registration."
+        audit_logger.critical(
+            "supplier_registration",
+            outcome="error",
+            reason=str(error),
+            company_name=self.company_name,
+            contact_email=self.contact_email,
+            exception_type=type(error).__name__,
+            ip_address=ip_address,
+        )
+
     def validate_form(self) -> bool:
         if not self.company_name:
             self.error_message = "Company name is required."
@@ -77,8 +117,13 @@ class SupplierRegisterState(rx.State):
         if not re.match(phone_regex, self.contact_phone):
             self.error_message = "Please enter a valid phone number format."
             return False
+        # Cheap structural reject before the full RFC parser runs
+        email = self.contact_email
+        if len(email) > 254 or email.count("@") != 1:
+            self.error_message = "Please enter a valid email address."
+            return False
         try:
-            validate_email(self.contact_email)
+            validate_email(email, check_deliverability=False)
         except EmailNotValidError:
             self.error_message = "Please enter a valid email address."
             return False
@@ -88,25 +133,30 @@ class SupplierRegisterState(rx.State):
         self.clear_messages()
         self.is_submitting = True
         ip_address = self.router.session.client_ip
-        transaction_id = str(uuid.uuid4())
-        audit_logger.info(
-            "attempt_supplier_registration",
-            company_name=self.company_name,
-            contact_email=self.contact_email,
-            contact_phone=self.contact_phone,
-            ip_address=ip_address,
-        )
 
+        # Rejected submissions emit a single event and never enter the
+        # audit context.
         if not self.validate_form():
             audit_logger.warning(
-                "supplier_registration_failed",
+                "supplier_registration",
+                outcome="validation_failed",
                 reason="Form validation failed",
                 error_message=self.error_message,
                 company_name=self.company_name,
+                contact_email=self.contact_email,
                 ip_address=ip_address,
             )
             self.is_submitting = False
             return
+
+        transaction_id = secrets.token_hex(16)
+        audit_logger.info(
+            "attempt_supplier_registration",
+            company_name=self.company_name,
+            contact_email=self.contact_email,
+            contact_phone=self.contact_phone,
+            ip_address=ip_address,
+        )
         async with with_async_audit_context(
             state=self,
             operation_name="supplier_registration",
@@ -115,74 +165,43 @@ class SupplierRegisterState(rx.State):
             submitted_contact_email=self.contact_email,
         ):
             try:
-                with rx.session() as session:
-                    # Check for existing supplier with the same company_name
-                    existing_supplier_by_name = session.exec(
-                        select(Supplier).where(
-                            Supplier.company_name == self.company_name
-                        )
-                    ).first()
-                    if existing_supplier_by_name:
-                        self.error_message = "This company name is already registered."
-                        self.is_submitting = False
-                        return
-                    # Check for existing supplier with the same contact_email
-                    existing_supplier = session.exec(
-                        select(Supplier).where(
-                            Supplier.contact_email == self.contact_email
-                        )
-                    ).first()
-                    if existing_supplier:
-                        self.error_message = "This email is already registered."
-                        self.is_submitting = False
-                        return
-
-                    supplier = Supplier(
-                        company_name=self.company_name,
-                        description=self.description,
-                        contact_email=self.contact_email,
-                        contact_phone=self.contact_phone,
-                        status="pending",
-                    )
-                    session.add(supplier)
-                    session.commit()
-                    session.refresh(supplier)
-                    supplier_id = supplier.id
-
-                    audit_logger.info(
-                        "supplier_created",
-                        company_name=self.company_name,
-                        supplier_id=supplier_id,
-                        contact_email=self.contact_email,
-                        status=supplier.status,
-                        ip_address=ip_address,
-                    )
-
-                    self.company_name = ""
-                    self.description = ""
-                    self.contact_email = ""
-                    self.contact_phone = ""
-                    self.success_message = (
-                        "Registration successful! Please wait for admin approval."
-                    )
-                    audit_logger.info(
-                        "success_supplier_registration",
-                        company_name=supplier.company_name,
-                        supplier_id=supplier_id,
-                        contact_email=supplier.contact_email,
-                        ip_address=ip_address,
-                    )
-
-            except Exception as e:
-                self.error_message = "An unexpected error occurred during registration."
-                audit_logger.critical(
-                    "supplier_registration_failed_unexpected",
-                    reason=str(e),
+                # Run the blocking DB round-trip off the event loop thread.
+                supplier = await asyncio.to_thread(
+                    _insert_supplier,
                     company_name=self.company_name,
+                    description=self.description,
                     contact_email=self.contact_email,
-                    exception_type=type(e).__name__,
+                    contact_phone=self.contact_phone,
+                )
+            except IntegrityError as ie:
+                # Unique indexes on company_name/contact_email are the
+                # source of truth; no pre-SELECT round-trip is needed.
+                # Any other constraint failure is unexpected, not a duplicate.
+                if "company_name" in str(ie.orig):
+                    self.error_message = "This company name is already registered."
+                elif "contact_email" in str(ie.orig):
+                    self.error_message = "This email is already registered."
+                else:
+                    self._registration_failed(ie, ip_address)
+            except Exception as e:
+                self._registration_failed(e, ip_address)
+            else:
+                audit_logger.info(
+                    "supplier_registration",
+                    outcome="success",
+                    company_name=supplier.company_name,
+                    supplier_id=supplier.id,
+                    contact_email=supplier.contact_email,
+                    status=supplier.status,
                     ip_address=ip_address,
                 )
-                session.rollback()
+
+                self.company_name = ""
+                self.description = ""
+                self.contact_email = ""
+                self.contact_phone = ""
+                self.success_message = (
+                    "Registration successful! Please wait for admin approval."
+                )
             finally:
                 self.is_submitting = False
@@ -1,44 +1,275 @@
 # user_data_service.py
-from typing import Any, Dict, List, Optional
+import base64
+import json
+import time
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 
 import reflex as rx
 import reflex_local_auth
+from sqlalchemy import desc, exists, func, or_, tuple_
 from sqlmodel import select
 
 from inventory_system.logging.logging import audit_logger
-from inventory_system.models.user import UserInfo
+from inventory_system.models.user import Role, UserInfo, UserRole
+
+# Columns users can be ordered by, keyed by the sort_value used in the UI.
+# Each keyset seek on (column, user_id) is backed by an index:
+#   username -> localuser.username (unique, so user_id never breaks a tie)
+#   email    -> ix_userinfo_email_user_id
+#   id       -> userinfo.user_id (unique)
+SORT_COLUMNS = {
+    "username": reflex_local_auth.LocalUser.username,
+    "email": UserInfo.email,
+    "id": UserInfo.user_id,
+}
+
+# Seconds a load_users_data result is reused before hitting the database again.
+USERS_CACHE_TTL = 5.0
+# Distinct argument sets kept before the cache is reset (one per search term).
+USERS_CACHE_MAXSIZE = 32
+# Rows streamed per batch (and per role lookup) by an unpaged users query.
+USERS_FETCH_BATCH = 500
+
+# Maps load_users_data arguments to (loaded_at, rows).
+_users_cache: Dict[Tuple, Tuple[float, List[Dict[str, Any]]]] = {}
+# Maps count_users arguments to (loaded_at, count).
+_users_count_cache: Dict[Tuple, Tuple[float, int]] = {}
 
 
 class UserDataService:
     """Shared service for loading user data across different states."""
 
     @staticmethod
-    def load_users_data(exclude_user_id: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Load users data with roles information."""
+    def load_users_data(
+        exclude_user_id: Optional[int] = None,
+        search_value: str = "",
+        sort_value: str = "username",
+        sort_reverse: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        backward: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Load users data with roles information.
+
+        The search predicate, ordering and paging are applied in SQL so only
+        matching rows are fetched from the database. With a cursor (see
+        encode_cursor) the page is found by a keyset seek on
+        (sort column, user_id) instead of OFFSET: rows after the cursor, or
+        the ``limit`` rows before it when ``backward`` is set; rows are always
+        returned in display order. Results are cached for USERS_CACHE_TTL
+        seconds; write paths call invalidate_cache().
+        """
+        key = (
+            exclude_user_id,
+            search_value,
+            sort_value,
+            sort_reverse,
+            limit,
+            offset,
+            cursor,
+            backward,
+        )
+        cached = _users_cache.get(key)
+        if cached and time.monotonic() - cached[0] < USERS_CACHE_TTL:
+            return list(cached[1])
+
+        users = UserDataService._query_users_data(*key)
+        if users is not None:
+            if len(_users_cache) >= USERS_CACHE_MAXSIZE:
+                _users_cache.clear()
+            _users_cache[key] = (time.monotonic(), users)
+            return list(users)
+        return []
+
+    @staticmethod
+    def encode_cursor(user_row: Dict[str, Any], sort_value: str) -> str:
+        """Opaque keyset cursor for a row: its sort key and user id."""
+        if sort_value not in SORT_COLUMNS:
+            sort_value = "username"
+        key = [user_row[sort_value], user_row["id"]]
+        return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[Any, int]:
+        sort_key, user_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return sort_key, user_id
+
+    @staticmethod
+    def count_users(
+        exclude_user_id: Optional[int] = None, search_value: str = ""
+    ) -> int:
+        """Count users matching the same filters as load_users_data.
+
+        Cached like load_users_data; returns 0 if the query fails.
+        """
+        key = (exclude_user_id, search_value)
+        cached = _users_count_cache.get(key)
+        if cached and time.monotonic() - cached[0] < USERS_CACHE_TTL:
+            return cached[1]
+
+        with rx.session() as session:
+            try:
+                stmt = UserDataService._apply_user_filters(
+                    select(func.count())
+                    .select_from(UserInfo)
+                    .join(
+                        reflex_local_auth.LocalUser,
+                        UserInfo.user_id == reflex_local_auth.LocalUser.id,
+                    ),
+                    exclude_user_id,
+                    search_value,
+                )
+                count = session.exec(stmt).one()
+            except Exception as e:
+                audit_logger.error("counting_users_failed", error=str(e))
+                return 0
+
+        if len(_users_count_cache) >= USERS_CACHE_MAXSIZE:
+            _users_count_cache.clear()
+        _users_count_cache[key] = (time.monotonic(), count)
+        return count
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop cached user rows after users, emails or roles change."""
+        _users_cache.clear()
+        _users_count_cache.clear()
+
+    @staticmethod
+    def _apply_user_filters(stmt, exclude_user_id: Optional[int], search_value: str):
+        """Add the exclusion and search predicates shared by list and count."""
+        if exclude_user_id:
+            stmt = stmt.where(UserInfo.user_id != exclude_user_id)
+
+        if search_value:
+            # Match the term literally: "%" and "_" are not wildcards here
+            escaped = (
+                search_value.replace("\\", "\\\\")
+                .replace("%", "\\%")
+                .replace("_", "\\_")
+            )
+            pattern = f"%{escaped}%"
+            role_match = exists().where(
+                UserRole.user_id == UserInfo.id,
+                UserRole.role_id == Role.id,
+                Role.is_active,
+                Role.name.ilike(pattern, escape="\\"),
+            )
+            stmt = stmt.where(
+                or_(
+                    reflex_local_auth.LocalUser.username.ilike(pattern, escape="\\"),
+                    UserInfo.email.ilike(pattern, escape="\\"),
+                    role_match,
+                )
+            )
+        return stmt
+
+    @staticmethod
+    def _query_users_data(
+        exclude_user_id: Optional[int],
+        search_value: str,
+        sort_value: str,
+        sort_reverse: bool,
+        limit: Optional[int],
+        offset: int,
+        cursor: Optional[str],
+        backward: bool,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Run the users query; returns None if it fails."""
         with rx.session() as session:
             try:
-                stmt = select(UserInfo, reflex_local_auth.LocalUser.username).join(
+                # Select only the columns the rows need; no UserInfo hydration
+                stmt = select(
+                    UserInfo.id,
+                    UserInfo.user_id,
+                    UserInfo.email,
+                    reflex_local_auth.LocalUser.username,
+                ).join(
                     reflex_local_auth.LocalUser,
                     UserInfo.user_id == reflex_local_auth.LocalUser.id,
                 )
+                stmt = UserDataService._apply_user_filters(
+                    stmt, exclude_user_id, search_value
+                )
 
-                if exclude_user_id:
-                    stmt = stmt.where(UserInfo.user_id != exclude_user_id)
-
-                results = session.exec(stmt).all()
+                sort_column = SORT_COLUMNS.get(sort_value, SORT_COLUMNS["username"])
+                # user_id breaks ties so keyset and OFFSET pages never overlap
+                sort_key = tuple_(sort_column, UserInfo.user_id)
+                # Walking backward reads the opposite order, then flips it back
+                descending = sort_reverse != backward
+                if cursor is not None:
+                    after = tuple_(*UserDataService._decode_cursor(cursor))
+                    stmt = stmt.where(
+                        sort_key < after if descending else sort_key > after
+                    )
+                if descending:
+                    stmt = stmt.order_by(desc(sort_column), desc(UserInfo.user_id))
+                else:
+                    stmt = stmt.order_by(sort_column, UserInfo.user_id)
+                if limit is not None:
+                    stmt = stmt.limit(limit).offset(offset)
+                else:
+                    # Stream an unpaged load so it never holds every raw row
+                    # alongside the built dicts or sends one huge IN list.
+                    # Pages skip it: on psycopg2 yield_per means a server-side
+                    # cursor and its extra DECLARE/FETCH/CLOSE round trips.
+                    stmt = stmt.execution_options(yield_per=USERS_FETCH_BATCH)
 
-                return [
-                    {
-                        "username": username,
-                        "id": user_info.user_id,
-                        "email": user_info.email,
-                        "roles": user_info.get_roles() or ["none"],
-                    }
-                    for user_info, username in results
-                ]
+                # Resolve each batch's roles as it arrives
+                users = []
+                for batch in session.exec(stmt).partitions():
+                    roles_by_info_id = UserDataService._load_role_names(
+                        session, [row[0] for row in batch]
+                    )
+                    users.extend(
+                        UserDataService._build_user_row(
+                            user_id=user_id,
+                            username=username,
+                            email=email,
+                            roles=roles_by_info_id.get(info_id) or ["none"],
+                        )
+                        for info_id, user_id, email, username in batch
+                    )
+                if backward:
+                    users.reverse()
+                return users
             except Exception as e:
                 audit_logger.error("loading_users_data_failed", error=str(e))
-                return []
+                return None
+
+    @staticmethod
+    def _load_role_names(session, info_ids: List[int]) -> Dict[int, List[str]]:
+        """Fetch active role names for the given UserInfo ids in one query."""
+        roles_by_info_id: Dict[int, List[str]] = {}
+        role_rows = session.exec(
+            select(UserRole.user_id, Role.name)
+            .join(Role, UserRole.role_id == Role.id)
+            .where(Role.is_active, UserRole.user_id.in_(info_ids))
+        ).all()
+        for info_id, role_name in role_rows:
+            roles_by_info_id.setdefault(info_id, []).append(role_name)
+        return roles_by_info_id
+
+    @staticmethod
+    def _build_user_row(
+        user_id: int, username: str, email: str, roles: List[str]
+    ) -> Dict[str, Any]:
+        """Build a user dict with a lowercased search blob of its fields."""
+        return {
+            "username": username,
+            "id": user_id,
+            "email": email,
+            "roles": roles,
+            # NUL-separated so a search term cannot match across two fields
+            "_search": "\x00".join([username, email, *roles]).lower(),
+        }
+
+    @staticmethod
+    def public_row(user_row: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop backend-only keys (e.g. _search) before a row is sent to the client."""
+        return {k: v for k, v in user_row.items() if not k.startswith("_")}
 
     @staticmethod
     def filter_users(
@@ -48,16 +279,15 @@ class UserDataService:
         sort_reverse: bool = False,
     ) -> List[Dict[str, Any]]:
         """Filter and sort users data."""
-        data = users_data
+        data = UserDataService.match_users(users_data, search_value)
+        return sorted(data, key=itemgetter(sort_value), reverse=sort_reverse)
 
-        if search_value:
-            search_lower = search_value.lower()
-            data = [
-                u
-                for u in data
-                if search_lower in u["username"].lower()
-                or search_lower in u["email"].lower()
-                or any(search_lower in role.lower() for role in u["roles"])
-            ]
-
-        return sorted(data, key=lambda x: x[sort_value], reverse=sort_reverse)
+    @staticmethod
+    def match_users(
+        users_data: List[Dict[str, Any]], search_value: str = ""
+    ) -> List[Dict[str, Any]]:
+        """Return the rows matching search_value, keeping their order."""
+        if not search_value:
+            return users_data
+        search_lower = search_value.lower()
+        return [u for u in users_data if search_lower in u["_search"]]
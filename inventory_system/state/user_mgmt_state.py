@@ -1,4 +1,10 @@
-from typing import Any, Dict, List, Optional
+import asyncio
+import contextlib
+import time
+import weakref
+import zlib
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import reflex as rx
 import reflex_local_auth
@@ -7,18 +13,115 @@ from sqlmodel import select
 from inventory_system.constants import available_colors
 from inventory_system.logging.audit_listeners import with_async_audit_context
 from inventory_system.logging.logging import audit_logger
-from inventory_system.models.user import Role, UserInfo, UserRole
+from inventory_system.models.user import UserInfo
 from inventory_system.state.auth import AuthState
-from inventory_system.state.user_data_service import UserDataService
+from inventory_system.state.role_data_service import RoleDataService
+from inventory_system.state.user_data_service import SORT_COLUMNS, UserDataService
+
+# Seconds during which check_auth_and_load skips reloading an unchanged view.
+USERS_RELOAD_INTERVAL = 2.0
+
+# One asyncio.Lock per user being edited; entries vanish once no handler holds them
+_user_locks: "weakref.WeakValueDictionary[int, asyncio.Lock]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _user_lock(user_id: int) -> asyncio.Lock:
+    """Lock serializing admin edits to one user without blocking other users."""
+    lock = _user_locks.get(user_id)
+    if lock is None:
+        lock = _user_locks[user_id] = asyncio.Lock()
+    return lock
+
+
+def _delete_users(user_ids: List[int]) -> List[Tuple[int, str]]:
+    """Delete users in one transaction; returns (id, username) of each deleted."""
+    with rx.session() as session:
+        # Lock the LocalUser and UserInfo rows in one round trip
+        local_users = session.exec(
+            select(reflex_local_auth.LocalUser)
+            .join(UserInfo, UserInfo.user_id == reflex_local_auth.LocalUser.id)
+            .where(reflex_local_auth.LocalUser.id.in_(user_ids))
+            .order_by(reflex_local_auth.LocalUser.id)
+            .with_for_update()
+        ).all()
+        deleted = [(local_user.id, local_user.username) for local_user in local_users]
+        # ORM deletes so the audit listeners record each user; ON DELETE
+        # CASCADE removes their UserInfo and UserRole rows. One commit covers all.
+        for local_user in local_users:
+            session.delete(local_user)
+        session.commit()
+        return deleted
+
+
+def _delete_user(user_id: int) -> Optional[str]:
+    """Delete a user; returns their username, or None if they do not exist."""
+    deleted = _delete_users([user_id])
+    return deleted[0][1] if deleted else None
+
+
+def _change_user_roles(
+    user_id: int, selected_roles: List[str]
+) -> Tuple[Optional[str], bool]:
+    """Replace a user's roles.
+
+    Returns the username (None if the user does not exist) and whether the
+    roles actually changed.
+    """
+    with rx.session() as session:
+        # Plain read: set_roles() takes the row lock (with a version check)
+        # only once we know the roles actually change.
+        row = session.exec(
+            select(UserInfo, reflex_local_auth.LocalUser.username)
+            .join(
+                reflex_local_auth.LocalUser,
+                UserInfo.user_id == reflex_local_auth.LocalUser.id,
+            )
+            .where(UserInfo.user_id == user_id)
+        ).one_or_none()
+        if not row:
+            return None, False
+        user_info, username = row
+        if frozenset(selected_roles) == frozenset(user_info.get_roles()):
+            return username, False
+        user_info.set_roles(selected_roles, session)
+        session.commit()
+        return username, True
+
+
+@lru_cache(maxsize=256)
+def _role_color(role: str) -> str:
+    """Pick a badge color from a stable CRC32 of the role name.
+
+    Unlike hash(), CRC32 is not salted per process, so a role keeps the same
+    color across workers and restarts.
+    """
+    return available_colors[
+        zlib.crc32(role.lower().encode("utf-8")) % len(available_colors)
+    ]
+
+
+@lru_cache(maxsize=32)
+def _compute_color_map(roles: Tuple[str, ...]) -> Dict[str, str]:
+    """Map each role to a badge color; cached per distinct role list."""
+    return {role: _role_color(role) for role in roles}
 
 
 class UserManagementState(AuthState):
-    users_data: List[Dict[str, Any]] = []
+    users_data: List[Dict[str, Any]] = []  # Current desktop page only
+    mobile_users_data: List[Dict[str, Any]] = []  # First mobile_displayed_count rows
+    total_user_count: int = 0  # Users matching search_value
+    has_more: bool = False  # Whether a page follows the current one
+    # Keyset cursor the current page starts after; None on the first page
+    _cursor: Optional[str] = None
     admin_error_message: str = ""
     admin_success_message: str = ""
     is_loading: bool = False
     show_delete_dialog: bool = False
     user_to_delete: Optional[int] = None
+    users_to_delete: List[int] = []  # Users ticked for bulk deletion
+    show_bulk_delete_dialog: bool = False
     page_number: int = 1
     page_size: int = 10
     sort_value: str = "username"
@@ -28,56 +131,119 @@ class UserManagementState(AuthState):
     target_user_id: Optional[int] = None
     # Changed from single role to multiple roles support
     selected_roles: List[str] = []
+    _selected_set: Set[str] = set()  # Backend-only membership for selected_roles
     current_user_roles: List[str] = []
     active_tab: str = "profiles"
 
     # New state variables for mobile layout
     mobile_displayed_count: int = 10  # Initial number of users to display on mobile
 
-    def check_auth_and_load(self):
+    # When and for which query the rows were last loaded (backend-only)
+    _users_data_loaded_at: float = 0.0
+    _users_data_loaded_for: Optional[Tuple] = None
+
+    def check_auth_and_load(self, force: bool = False):
         if not self.is_authenticated or not (
-            self.is_authenticated_and_ready and "manage_users" in self.permissions
+            self.is_authenticated_and_ready and self.has_permission("manage_users")
         ):
             return rx.redirect(reflex_local_auth.routes.LOGIN_ROUTE)
+        # Skip repeated loads of the same view (e.g. on_load firing again)
+        if (
+            not force
+            and self._users_data_loaded_for == self._loaded_for()
+            and time.monotonic() - self._users_data_loaded_at < USERS_RELOAD_INTERVAL
+        ):
+            return
         self.is_loading = True
-        current_user_id = self.user_id if self.is_authenticated_and_ready else None
-        self.users_data = UserDataService.load_users_data(
-            exclude_user_id=current_user_id
-        )
+        self._load_users()
         self.is_loading = False
 
+    def _loaded_for(self) -> Tuple:
+        return (
+            *self._query_args().values(),
+            self._cursor,
+            self.page_size,
+            self.mobile_displayed_count,
+        )
+
+    def _query_args(self) -> Dict[str, Any]:
+        return {
+            "exclude_user_id": self.user_id
+            if self.is_authenticated_and_ready
+            else None,
+            "search_value": self.search_value,
+            "sort_value": self.sort_value,
+            "sort_reverse": self.sort_reverse,
+        }
+
+    def _load_users(self):
+        """Fetch the match count, the desktop page and the mobile rows from SQL.
+
+        Searching, sorting and paging all run in the database, so state only
+        ever holds a page worth of users rather than the whole table.
+        """
+        self._set_users(self._fetch_users())
+
+    def _fetch_users(self) -> Dict[str, Any]:
+        """Run _load_users' queries without touching state; returns the updates.
+
+        Only reads state, so async handlers can run it via asyncio.to_thread.
+        """
+        args = self._query_args()
+        count = UserDataService.count_users(
+            exclude_user_id=args["exclude_user_id"], search_value=args["search_value"]
+        )
+        cursor, page_number = self._cursor, self.page_number
+        rows, has_more = self._page_after(cursor)
+        if not rows and cursor is not None:
+            # The page emptied (e.g. its last user was deleted); step back
+            total_pages = max(1, (count + self.page_size - 1) // self.page_size)
+            remainder = count - (total_pages - 1) * self.page_size
+            rows, cursor, has_more = self._page_ending_before(None, max(remainder, 1))
+            page_number = total_pages if cursor is not None else 1
+        return {
+            "total_user_count": count,
+            "users_data": rows,
+            "has_more": has_more,
+            "_cursor": cursor,
+            "page_number": page_number,
+            "mobile_users_data": self._fetch_rows(self.mobile_displayed_count),
+        }
+
+    def _set_users(self, updates: Dict[str, Any]):
+        """Apply the result of _fetch_users and note what was loaded."""
+        for name, value in updates.items():
+            setattr(self, name, value)
+        self._users_data_loaded_at = time.monotonic()
+        self._users_data_loaded_for = self._loaded_for()
+
     @rx.var
     def available_roles(self) -> List[str]:
         """Get all available roles from the database dynamically"""
-        with rx.session() as session:
-            try:
-                # Get all roles from the database
-                roles = session.exec(select(Role)).all()
-                role_names = [role.name for role in roles]
-                all_roles = set(role_names)
-
-                return sorted(list(all_roles))
-            except Exception as e:
-                # Fallback to common roles if database query fails
-                audit_logger.error(
-                    "loading_roles_failed",
-                    reason=f"Database error: {str(e)}",
-                )
-                return sorted(["admin", "employee", "manager", "viewer"])
+        try:
+            return RoleDataService.load_role_names()
+        except Exception as e:
+            # Fallback to common roles if database query fails
+            audit_logger.error(
+                "loading_roles_failed",
+                reason=f"Database error: {str(e)}",
+            )
+            return sorted(["admin", "employee", "manager", "viewer"])
 
     @rx.var
     def role_color_map(self) -> Dict[str, str]:
         """Create a mapping of roles to colors"""
+        return dict(_compute_color_map(tuple(self.available_roles)))
 
-        color_map = {}
-        for role in self.available_roles:
-            role_hash = hash(role.lower()) % len(available_colors)
-            color_map[role] = available_colors[role_hash]
-        return color_map
+    def _fail(self, message: str):
+        """Record an admin action failure and return its error toast."""
+        self.setvar("admin_error_message", message)
+        self.setvar("is_loading", False)
+        return rx.toast.error(message, position="bottom-right", duration=5000)
 
     @rx.event
     async def delete_user(self):
-        if "delete_user" not in self.permissions:
+        if not self.has_permission("delete_user"):
             yield rx.toast.error(
                 "Permission denied: Cannot delete user", position="bottom-right"
             )
@@ -88,128 +254,148 @@ class UserManagementState(AuthState):
         self.setvar("admin_error_message", "")
         self.setvar("admin_success_message", "")
 
+        target_user_id = self.user_to_delete
         async with with_async_audit_context(
             state=self,  # Automatically extracts user_info and request context
             operation_name="user_deletion",
-            target_user_id=self.user_to_delete,
+            target_user_id=target_user_id,
             risk_level="medium",  # Additional context for future approval workflows
         ):
-            with rx.session() as session:
-                try:
-                    user_info = session.exec(
-                        select(UserInfo)
-                        .where(UserInfo.user_id == self.user_to_delete)
-                        .with_for_update()
-                    ).one_or_none()
-                    if not user_info:
-                        self.setvar("admin_error_message", "User not found.")
-                        self.setvar("is_loading", False)
-                        yield rx.toast.error(
-                            self.admin_error_message,
-                            position="bottom-right",
-                            duration=5000,
-                        )
-                        return
-
-                    local_user = session.exec(
-                        select(reflex_local_auth.LocalUser).where(
-                            reflex_local_auth.LocalUser.id == user_info.user_id
-                        )
-                    ).one_or_none()
-                    if not local_user:
-                        self.setvar("admin_error_message", "Local user not found.")
-                        self.setvar("is_loading", False)
-                        yield rx.toast.error(
-                            self.admin_error_message,
-                            position="bottom-right",
-                            duration=5000,
-                        )
-                        return
-
-                    target_username = local_user.username
-
-                    # CRITICAL: Delete UserRole records first to prevent orphaned records
-                    # This handles the case where UserRole.user_id references userinfo.user_id
-                    session.exec(
-                        UserRole.__table__.delete().where(
-                            UserRole.user_id == user_info.user_id
-                        )
+            try:
+                # Run the blocking transaction off the event loop thread
+                async with _user_lock(target_user_id):
+                    target_username = await asyncio.to_thread(
+                        _delete_user, target_user_id
                     )
+                if target_username is None:
+                    yield self._fail("User not found.")
+                    return
+
+                UserDataService.invalidate_cache()
+                self.setvar(
+                    "admin_success_message",
+                    f"User {target_username} deleted successfully.",
+                )
+                self.setvar("show_delete_dialog", False)
+                self.setvar("user_to_delete", None)
+                await self._drop_deleted_rows({target_user_id})
+                self.setvar("is_loading", False)
+                audit_logger.info(
+                    "delete_user_success",
+                    target_user_id=target_user_id,
+                    target_username=target_username,
+                )
+                yield rx.toast.success(
+                    self.admin_success_message,
+                    position="bottom-right",
+                    duration=5000,
+                )
 
-                    # Then delete UserInfo and LocalUser
-                    if local_user:
-                        session.delete(local_user)
-                    session.commit()
-                    self.setvar(
-                        "admin_success_message",
-                        f"User {target_username} deleted successfully.",
-                    )
-                    self.check_auth_and_load()
-                    self.setvar("is_loading", False)
-                    self.setvar("show_delete_dialog", False)
-                    self.setvar("user_to_delete", None)
-                    audit_logger.info(f"User {target_username} deleted successfully.")
-                    yield rx.toast.success(
-                        self.admin_success_message,
-                        position="bottom-right",
-                        duration=5000,
-                    )
+            except Exception as e:
+                yield self._fail(f"Failed to delete user: {str(e)}")
 
-                except Exception as e:
-                    session.rollback()
-                    self.setvar(
-                        "admin_error_message", f"Failed to delete user: {str(e)}"
-                    )
-                    self.setvar("is_loading", False)
-                    yield rx.toast.error(
-                        self.admin_error_message, position="bottom-right", duration=5000
-                    )
+    @rx.event
+    async def delete_selected_users(self):
+        """Delete every ticked user in a single transaction."""
+        if not self.has_permission("delete_user"):
+            yield rx.toast.error(
+                "Permission denied: Cannot delete user", position="bottom-right"
+            )
+            return
+        # Never delete the acting admin, even if their id was submitted
+        user_ids = sorted(set(self.users_to_delete) - {self.user_id})
+        if not user_ids:
+            return
+        self.is_loading = True
+        self.setvar("admin_error_message", "")
+        self.setvar("admin_success_message", "")
 
-    @rx.var
-    def total_pages(self) -> int:
-        return max(1, (len(self.filtered_users) + self.page_size - 1) // self.page_size)
+        async with with_async_audit_context(
+            state=self,  # Automatically extracts user_info and request context
+            operation_name="bulk_user_deletion",
+            target_user_ids=user_ids,
+            risk_level="high",  # Additional context for future approval workflows
+        ):
+            try:
+                async with contextlib.AsyncExitStack() as stack:
+                    # Take the per-user locks in id order so batches cannot deadlock
+                    for user_id in user_ids:
+                        await stack.enter_async_context(_user_lock(user_id))
+                    deleted = await asyncio.to_thread(_delete_users, user_ids)
+
+                UserDataService.invalidate_cache()
+                self.setvar("admin_success_message", f"Deleted {len(deleted)} user(s).")
+                self.setvar("show_bulk_delete_dialog", False)
+                self.setvar("users_to_delete", [])
+                await self._drop_deleted_rows({user_id for user_id, _ in deleted})
+                self.setvar("is_loading", False)
+                audit_logger.info(
+                    "delete_users_success",
+                    target_user_ids=[user_id for user_id, _ in deleted],
+                    target_usernames=[username for _, username in deleted],
+                )
+                yield rx.toast.success(
+                    self.admin_success_message,
+                    position="bottom-right",
+                    duration=5000,
+                )
+
+            except Exception as e:
+                yield self._fail(f"Failed to delete users: {str(e)}")
+
+    async def _drop_deleted_rows(self, user_ids: Set[int]):
+        """Remove deleted users from the loaded rows instead of re-querying."""
+        self.users_data = [u for u in self.users_data if u["id"] not in user_ids]
+        self.mobile_users_data = [
+            u for u in self.mobile_users_data if u["id"] not in user_ids
+        ]
+        self.users_to_delete = [i for i in self.users_to_delete if i not in user_ids]
+        self.total_user_count = max(0, self.total_user_count - len(user_ids))
+        if not self.users_data:
+            # The page emptied; load its neighbour from the database, off the
+            # event loop thread like the delete itself
+            self._set_users(await asyncio.to_thread(self._fetch_users))
 
     @rx.var
-    def filtered_users(self) -> List[Dict[str, Any]]:
-        return UserDataService.filter_users(
-            users_data=self.users_data,
-            search_value=self.search_value,
-            sort_value=self.sort_value,
-            sort_reverse=self.sort_reverse,
-        )
+    def total_pages(self) -> int:
+        return max(1, (self.total_user_count + self.page_size - 1) // self.page_size)
 
     @rx.var
     def current_page(self) -> List[Dict[str, Any]]:
-        start = (self.page_number - 1) * self.page_size
-        end = start + self.page_size
-        return self.filtered_users[start:end]
+        # users_data is already searched, sorted and sliced in SQL
+        return self.users_data
 
     @rx.var
     def mobile_displayed_users(self) -> List[Dict[str, Any]]:
         """Computes the list of users to display on mobile based on mobile_displayed_count."""
-        return self.filtered_users[: self.mobile_displayed_count]
+        return self.mobile_users_data
 
     @rx.var
     def has_more_users(self) -> bool:
         """Determines if there are more users to load on mobile."""
-        return len(self.filtered_users) > self.mobile_displayed_count
+        return self.total_user_count > len(self.mobile_users_data)
 
     def load_more(self):
-        """Increments the number of displayed users on mobile by page_size."""
-        self.mobile_displayed_count += self.page_size
+        """Fetches the next page_size users and appends them on mobile."""
+        if not self.mobile_users_data:
+            return
+        self.mobile_users_data = self.mobile_users_data + self._fetch_rows(
+            self.page_size, cursor=self._cursor_for(self.mobile_users_data[-1])
+        )
+        self.mobile_displayed_count = len(self.mobile_users_data)
 
     def open_edit_dialog(self, user_id: int, current_roles: List[str]):
         """Updated to handle multiple roles"""
         self.target_user_id = user_id
         self.current_user_roles = current_roles
-        self.selected_roles = (
-            current_roles.copy()
-        )  # Copy the list to avoid reference issues
+        self._selected_set = set(current_roles)
+        self.selected_roles = sorted(self._selected_set)
         self.show_edit_dialog = True
 
     def cancel_edit_dialog(self):
         self.show_edit_dialog = False
         self.target_user_id = None
+        self._selected_set = set()
         self.selected_roles = []
         self.current_user_roles = []
 
@@ -221,40 +407,121 @@ class UserManagementState(AuthState):
         self.show_delete_dialog = False
         self.user_to_delete = None
 
+    def toggle_delete_selection(self, user_id: int):
+        """Tick or untick a user for bulk deletion."""
+        if user_id in self.users_to_delete:
+            self.users_to_delete.remove(user_id)
+        else:
+            self.users_to_delete.append(user_id)
+
+    def confirm_delete_selected(self):
+        if self.users_to_delete:
+            self.show_bulk_delete_dialog = True
+
+    def cancel_bulk_delete(self):
+        self.show_bulk_delete_dialog = False
+
     def set_sort_value(self, value: str):
+        # Only indexed columns may be sorted on; ignore anything else
+        if value not in SORT_COLUMNS:
+            return
         self.sort_value = value
-        self.mobile_displayed_count = 10  # Reset for mobile
+        self._reset_paging()
+        self._load_users()
 
     def toggle_sort(self):
         self.sort_reverse = not self.sort_reverse
-        self.mobile_displayed_count = 10  # Reset for mobile
+        self._reset_paging()
+        self._load_users()
 
     def set_search_value(self, value: str):
         self.search_value = value
+        self._reset_paging()
+        return self.check_auth_and_load()
+
+    def _reset_paging(self):
+        # Cursors are only valid for the ordering and filter they came from
         self.page_number = 1  # For desktop pagination
+        self._cursor = None
         self.mobile_displayed_count = 10  # Reset for mobile
 
     # New methods for handling multiple role selection
     def toggle_role_selection(self, role: str):
         """Toggle a role in the selected roles list"""
-        if role in self.selected_roles:
-            self.selected_roles = [r for r in self.selected_roles if r != role]
+        if role in self._selected_set:
+            self._selected_set.discard(role)
         else:
-            self.selected_roles = self.selected_roles + [role]
+            self._selected_set.add(role)
+        self.selected_roles = sorted(self._selected_set)
+
+    def _cursor_for(self, user_row: Dict[str, Any]) -> str:
+        return UserDataService.encode_cursor(user_row, self.sort_value)
+
+    def _fetch_rows(
+        self, limit: int, cursor: Optional[str] = None, backward: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Load one keyset slice of users, without the backend-only search blob."""
+        return [
+            UserDataService.public_row(u)
+            for u in UserDataService.load_users_data(
+                **self._query_args(), limit=limit, cursor=cursor, backward=backward
+            )
+        ]
+
+    def _page_after(self, cursor: Optional[str]) -> Tuple[List[Dict[str, Any]], bool]:
+        """The page starting after cursor, and whether another page follows."""
+        rows = self._fetch_rows(self.page_size + 1, cursor=cursor)
+        return rows[: self.page_size], len(rows) > self.page_size
+
+    def _load_page(self):
+        """Load the page starting after _cursor, peeking one row past it."""
+        self.users_data, self.has_more = self._page_after(self._cursor)
+
+    def _page_ending_before(
+        self, cursor: Optional[str], size: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], bool]:
+        """The ``size`` rows before cursor (or the last ones if None).
+
+        Also returns the cursor that page starts after and its has_more.
+        """
+        rows = self._fetch_rows(size + 1, cursor=cursor, backward=True)
+        # The extra row, if any, is the last row of the preceding page
+        start = self._cursor_for(rows[0]) if len(rows) > size else None
+        return (rows[-size:] if rows else []), start, cursor is not None
+
+    def _load_page_ending_before(self, cursor: Optional[str], size: int):
+        """Load the ``size`` rows before cursor (or the last ones if None)."""
+        self.users_data, self._cursor, self.has_more = self._page_ending_before(
+            cursor, size
+        )
 
     def first_page(self):
         self.page_number = 1
+        self._cursor = None
+        self._load_page()
 
     def prev_page(self):
-        if self.page_number > 1:
+        if self.page_number <= 1 or not self.users_data:
+            return
+        self._load_page_ending_before(
+            self._cursor_for(self.users_data[0]), self.page_size
+        )
+        if self._cursor is None:
+            # Reached the start; refill in case rows were added meanwhile
+            self.first_page()
+        else:
             self.page_number -= 1
 
     def next_page(self):
-        if self.page_number < self.total_pages:
+        if self.has_more and self.users_data:
+            self._cursor = self._cursor_for(self.users_data[-1])
             self.page_number += 1
+            self._load_page()
 
     def last_page(self):
-        self.page_number = self.total_pages
+        remainder = self.total_user_count - (self.total_pages - 1) * self.page_size
+        self._load_page_ending_before(None, max(remainder, 1))
+        self.page_number = self.total_pages if self._cursor is not None else 1
 
     def set_active_tab(self, tab: str):
         self.active_tab = tab
@@ -262,7 +529,7 @@ class UserManagementState(AuthState):
     @rx.event
     async def change_user_roles(self, user_id: int, selected_roles: List[str]):
         """Updated to handle multiple roles assignment"""
-        if "edit_user" not in self.permissions:
+        if not self.has_permission("edit_user"):
             yield rx.toast.error(
                 "Permission denied: Cannot change user roles", position="bottom-right"
             )
@@ -274,6 +541,9 @@ class UserManagementState(AuthState):
             )
             return
 
+        # Dedupe once, keeping order; set_roles() rejects repeated names
+        selected_roles = list(dict.fromkeys(selected_roles))
+
         self.is_loading = True
         self.setvar("admin_error_message", "")
         self.setvar("admin_success_message", "")
@@ -285,77 +555,51 @@ class UserManagementState(AuthState):
             new_roles=selected_roles,
             risk_level="medium",  # Additional context for future approval workflows
         ):
-            with rx.session() as session:
-                try:
-                    user_info = session.exec(
-                        select(UserInfo)
-                        .where(UserInfo.user_id == user_id)
-                        .with_for_update()
-                    ).one_or_none()
-                    if not user_info:
-                        self.setvar("admin_error_message", "User info not found.")
-                        self.setvar("is_loading", False)
-                        yield rx.toast.error(
-                            self.admin_error_message,
-                            position="bottom-right",
-                            duration=5000,
-                        )
-                        return
-
-                    local_user = session.exec(
-                        select(reflex_local_auth.LocalUser).where(
-                            reflex_local_auth.LocalUser.id == user_id
-                        )
-                    ).one_or_none()
-                    if not local_user:
-                        self.setvar("admin_error_message", "User not found.")
-                        self.setvar("is_loading", False)
-                        yield rx.toast.error(
-                            self.admin_error_message,
-                            position="bottom-right",
-                            duration=5000,
-                        )
-                        return
-
-                    target_username = local_user.username
-                    original_roles = user_info.get_roles()
-
-                    # Check if roles are actually changing
-                    if set(selected_roles) == set(original_roles):
-                        self.setvar("is_loading", False)
-                        yield rx.toast.info(
-                            f"No change: User {target_username} already has these roles.",
-                            position="bottom-right",
-                            duration=5000,
-                        )
-                        return
-
-                    session.add(user_info)
-                    session.refresh(user_info)
-                    user_info.set_roles(selected_roles, session)
-                    session.commit()
-
-                    roles_str = ", ".join(selected_roles)
-                    self.setvar(
-                        "admin_success_message",
-                        f"User {target_username} roles updated to: {roles_str}.",
+            try:
+                # Run the blocking transaction off the event loop thread
+                async with _user_lock(user_id):
+                    target_username, changed = await asyncio.to_thread(
+                        _change_user_roles, user_id, selected_roles
                     )
-                    self.check_auth_and_load()
+                if target_username is None:
+                    yield self._fail("User not found.")
+                    return
+
+                if not changed:
                     self.setvar("is_loading", False)
-                    self.setvar("show_edit_dialog", False)
-                    self.setvar("target_user_id", None)
-                    yield rx.toast.success(
-                        self.admin_success_message,
+                    yield rx.toast.info(
+                        f"No change: User {target_username} already has these roles.",
                         position="bottom-right",
                         duration=5000,
                     )
+                    return
 
-                except Exception as e:
-                    session.rollback()
-                    self.setvar(
-                        "admin_error_message", f"Failed to change roles: {str(e)}"
-                    )
-                    self.setvar("is_loading", False)
-                    yield rx.toast.error(
-                        self.admin_error_message, position="bottom-right", duration=5000
-                    )
+                UserDataService.invalidate_cache()
+
+                roles_str = ", ".join(selected_roles)
+                self.setvar(
+                    "admin_success_message",
+                    f"User {target_username} roles updated to: {roles_str}.",
+                )
+                # Patch the changed row locally instead of re-querying; no
+                # roles shows as ["none"], as in UserDataService rows
+                row_roles = selected_roles or ["none"]
+                self.users_data = [
+                    {**u, "roles": row_roles} if u["id"] == user_id else u
+                    for u in self.users_data
+                ]
+                self.mobile_users_data = [
+                    {**u, "roles": row_roles} if u["id"] == user_id else u
+                    for u in self.mobile_users_data
+                ]
+                self.setvar("is_loading", False)
+                self.setvar("show_edit_dialog", False)
+                self.setvar("target_user_id", None)
+                yield rx.toast.success(
+                    self.admin_success_message,
+                    position="bottom-right",
+                    duration=5000,
+                )
+
+            except Exception as e:
+                yield self._fail(f"Failed to change roles: {str(e)}")
@@ -0,0 +1,170 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import reflex as rx
+import reflex_local_auth
+import requests
+from reflex.testing import AppHarness
+from sqlmodel import Session, create_engine
+
+from inventory_system.models.user import Role, UserInfo, UserRole
+from inventory_system.tests.test_utils import (
+    TEST_USERNAME,
+    delete_test_users,
+    get_wsl_host,
+)
+
+
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args):
+    """Launch options for the browser shared by all end-to-end tests.
+
+    Headless unless pytest-playwright's ``--headed`` flag is given.
+    """
+    return {
+        **browser_type_launch_args,
+        "channel": "chromium",
+        "args": ["--disable-dev-shm-usage"],
+    }
+
+
+def _probe(url):
+    """Return True if the frontend at ``url`` serves the login page."""
+    try:
+        return requests.get(f"{url}/login", timeout=1, allow_redirects=True).ok
+    except requests.RequestException:
+        return False
+
+
+@pytest.fixture(scope="session")
+def inventory_app(pytestconfig):
+    """Start the inventory app using AppHarness.
+
+    Given ``--base-url`` (pytest-base-url, a pytest-playwright dependency),
+    attach to that already running app instead of compiling and starting one.
+    """
+    base_url = pytestconfig.getoption("base_url", None)
+    if base_url:
+        yield SimpleNamespace(frontend_url=base_url.rstrip("/"))
+        return
+
+    with AppHarness.create(
+        root=Path(__file__).parent.parent.parent, app_name="inventory_system"
+    ) as harness:
+        assert harness.frontend_url, "Frontend URL unavailable"
+        wsl_host = get_wsl_host()
+        frontend_urls = [
+            harness.frontend_url,
+            harness.frontend_url.replace("localhost", "127.0.0.1"),
+            harness.frontend_url.replace("localhost", wsl_host),
+        ]
+        print(f"Starting app, trying URLs: {frontend_urls}")
+        start_time = time.time()
+        timeout = 90
+        delay = 0.05  # Backoff between polling rounds, doubled up to 1s
+        responsive_url = None
+        # Probe all candidates concurrently each round so a host that drops
+        # packets can't delay the others by its request timeout
+        with ThreadPoolExecutor(max_workers=len(frontend_urls)) as pool:
+            while responsive_url is None:
+                probes = {pool.submit(_probe, url): url for url in frontend_urls}
+                for probe in as_completed(probes):
+                    if probe.result():
+                        responsive_url = probes[probe]
+                        print(f"Frontend responsive at {responsive_url}")
+                        break
+                else:
+                    elapsed = time.time() - start_time
+                    if elapsed >= timeout:
+                        raise RuntimeError(
+                            f"Frontend did not respond within {timeout}s"
+                        )
+                    print(f"Waiting for frontend... ({elapsed:.1f}s)")
+                    time.sleep(delay)
+                    delay = min(delay * 2, 1.0)
+        if responsive_url != harness.frontend_url:
+            harness.frontend_url = responsive_url
+        yield harness
+
+
+# Resource types the flows never assert on; stylesheets still load so
+# visibility checks see the real layout
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+
+def _skip_static_media(route):
+    """Abort image, font and media requests; let everything else through."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+@pytest.fixture
+def edge_page(browser):
+    """Provide a Playwright page in a fresh context of the shared browser.
+
+    ``browser`` is pytest-playwright's session-scoped fixture, so Chromium is
+    launched once per run; each test still gets its own isolated context.
+    """
+    context = browser.new_context()
+    context.route("**/*", _skip_static_media)
+    page = context.new_page()
+    page.set_default_timeout(20000)
+    page.set_default_navigation_timeout(25000)
+    page.on("console", lambda msg: print(f"Console: {msg.text}"))
+    yield page
+    context.close()
+
+
+@pytest.fixture(scope="module")
+def test_users_cleaned_up():
+    """Delete the shared test user (and its UserInfo, roles and Supplier).
+
+    Module-scoped: each flow registers the same user, so it must be
+    removed again before every module that uses it.
+    """
+    delete_test_users([TEST_USERNAME])
+
+
+@pytest.fixture
+def sqlite_users(request, monkeypatch, tmp_path):
+    """Point rx.session at a SQLite database seeded with the given users.
+
+    Parametrize indirectly with a list of (username, email) pairs. The
+    database is a file, so worker threads from asyncio.to_thread see it too.
+    Returns the LocalUser ids in seed order.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'users.db'}")
+    rx.Model.metadata.create_all(
+        engine,
+        tables=[
+            reflex_local_auth.LocalUser.__table__,
+            UserInfo.__table__,
+            Role.__table__,
+            UserRole.__table__,
+        ],
+    )
+    user_ids = []
+    with Session(engine) as session:
+        for username, email in request.param:
+            user = reflex_local_auth.LocalUser(
+                username=username, password_hash=b"x", enabled=True
+            )
+            session.add(user)
+            session.flush()
+            session.add(UserInfo(email=email, user_id=user.id))
+            user_ids.append(user.id)
+        session.commit()
+
+    @contextmanager
+    def _session():
+        with Session(engine) as session:
+            yield session
+
+    monkeypatch.setattr(rx, "session", _session)
+    return user_ids
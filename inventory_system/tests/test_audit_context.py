@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+import reflex_local_auth
+
+from inventory_system.logging.audit_listeners import (
+    enhanced_audit_listener,
+    register_model_for_audit,
+    with_async_audit_context,
+)
+from inventory_system.state.user_mgmt_state import _delete_user
+
+
+@pytest.fixture
+def audited_db(sqlite_users, monkeypatch):
+    """Audit LocalUser changes in the seeded database for one test.
+
+    Returns the seeded user ids and the list that collects audit entries as
+    the listener flushes them.
+    """
+    flushed = []
+
+    def _flush_pending_audits():
+        with enhanced_audit_listener._lock:
+            flushed.extend(enhanced_audit_listener._pending_audits)
+            enhanced_audit_listener._pending_audits.clear()
+
+    monkeypatch.setattr(
+        enhanced_audit_listener, "flush_pending_audits", _flush_pending_audits
+    )
+    local_user = reflex_local_auth.LocalUser
+    already_tracked = local_user in enhanced_audit_listener._tracked_models
+    register_model_for_audit(local_user)
+    yield sqlite_users, flushed
+    if not already_tracked:
+        enhanced_audit_listener.unregister_model(local_user)
+
+
+@pytest.mark.parametrize(
+    "sqlite_users",
+    [[("target_a", "target_a@example.com"), ("target_b", "target_b@example.com")]],
+    indirect=True,
+)
+async def test_overlapping_handlers_keep_their_own_audit_context(audited_db):
+    """Each deletion's audit entry names the admin whose handler ran it.
+
+    Both handlers enter their audit context before either worker thread
+    flushes, as happens when two admins delete users at the same time.
+    """
+    (target_a, target_b), flushed = audited_db
+    entered = {"admin_a": asyncio.Event(), "admin_b": asyncio.Event()}
+
+    async def delete_as(admin_id, admin_name, other, target_user_id):
+        async with with_async_audit_context(
+            operation_name="user_deletion",
+            user_id=admin_id,
+            username=admin_name,
+            target_user_id=target_user_id,
+        ):
+            entered[admin_name].set()
+            await entered[other].wait()
+            await asyncio.to_thread(_delete_user, target_user_id)
+
+    await asyncio.gather(
+        delete_as(1, "admin_a", "admin_b", target_a),
+        delete_as(2, "admin_b", "admin_a", target_b),
+    )
+
+    deleted_by = {
+        int(entry["entity_id"]): (entry["user_id"], entry["username"])
+        for entry in flushed
+        if entry["entity_type"] == "localuser"
+    }
+    assert deleted_by == {target_a: (1, "admin_a"), target_b: (2, "admin_b")}
+    assert enhanced_audit_listener.get_current_context() == {}
@@ -1,13 +1,12 @@
 import re
-import time
 
 import pytest
 import reflex as rx
-from playwright.sync_api import expect
-from sqlmodel import select
+from playwright.sync_api import Page, expect
+from reflex.testing import AppHarness
+from sqlmodel import delete, select
 
 from inventory_system.models.user import Supplier
-from inventory_system.tests.test_utils import edge_page, inventory_app
 
 # Test supplier constants
 TEST_COMPANY_NAME = "TestSupplier123"
@@ -21,45 +20,37 @@ TEST_PHONE = "+8801234567890"
 def test_suppliers_cleaned_up():
     """Clean up test suppliers before tests."""
     with rx.session() as session:
-        test_supplier = session.exec(
-            select(Supplier).where(Supplier.contact_email == TEST_EMAIL)
-        ).one_or_none()
-        if test_supplier:
-            session.delete(test_supplier)
+        session.exec(delete(Supplier).where(Supplier.contact_email == TEST_EMAIL))
         session.commit()
 
 
+@pytest.mark.e2e
 @pytest.mark.usefixtures("test_suppliers_cleaned_up")
-def test_supplier_registration(inventory_app: inventory_app, edge_page: edge_page):
+def test_supplier_registration(inventory_app: AppHarness, edge_page: Page):
     """Test the supplier registration flow in Microsoft Edge."""
     assert inventory_app.frontend_url, "Frontend URL missing"
 
+    # Match the frontend URL literally; its "." and ":" are not regex syntax
+    frontend_url = re.escape(inventory_app.frontend_url)
+
     def _url(url):
         """Create a regex URL pattern."""
-        return re.compile(inventory_app.frontend_url + url)
+        return re.compile(frontend_url + url)
 
     page = edge_page
     print("Starting supplier registration test")
 
-    # Navigate to supplier registration page with retry
-    for attempt in range(1, 4):
-        try:
-            print(f"Navigating to supplier registration page (attempt {attempt}/3)")
-            page.goto(inventory_app.frontend_url + "/supplier-register")
-            page.wait_for_load_state("networkidle")
-            expect(page).to_have_url(_url("/supplier-register"))
-            expect(page).to_have_title("Supplier Registration", timeout=30000)
-            break
-        except Exception as e:
-            print(f"Navigation failed: {e}")
-            if attempt == 3:
-                raise
-            time.sleep(2)
+    # Navigate to supplier registration page
+    page.goto(
+        inventory_app.frontend_url + "/supplier-register", wait_until="domcontentloaded"
+    )
+    expect(page).to_have_url(_url("/supplier-register"))
+    expect(page).to_have_title("Supplier Registration", timeout=20000)
 
     # Verify form is present
     print("Verifying form presence")
     form = page.locator('form:has-text("Supplier Registration")')
-    expect(form).to_be_visible(timeout=30000)
+    expect(form).to_be_visible(timeout=20000)
     expect(page.get_by_text("Supplier Registration")).to_be_visible(timeout=15000)
 
     # Fill out the form
@@ -86,7 +77,6 @@ def test_supplier_registration(inventory_app: inventory_app, edge_page: edge_pag
     # Submit the form
     print("Submitting registration form")
     submit_button = page.get_by_role("button", name="Register", exact=True)
-    expect(submit_button).to_be_enabled(timeout=15000)
     submit_button.click()
 
     # Verify success message
@@ -95,7 +85,7 @@ def test_supplier_registration(inventory_app: inventory_app, edge_page: edge_pag
     success_message = page.get_by_role("alert").filter(
         has_text=re.compile(r"Registration successful")
     )
-    expect(success_message).to_be_visible(timeout=30000)
+    expect(success_message).to_be_visible(timeout=20000)
 
     # Verify supplier in database
     print("Verifying supplier in database")
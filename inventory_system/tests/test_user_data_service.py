@@ -0,0 +1,41 @@
+import pytest
+
+from inventory_system.state.user_data_service import UserDataService
+
+pytestmark = pytest.mark.parametrize(
+    "sqlite_users",
+    [
+        [
+            ("test_user", "test@example.com"),
+            ("testXuser", "x@example.com"),
+            ("percent", "100%@example.com"),
+        ]
+    ],
+    indirect=True,
+)
+
+
+@pytest.fixture
+def users_db(sqlite_users):
+    """Point UserDataService at a SQLite database with a few users."""
+    UserDataService.invalidate_cache()
+    yield
+    UserDataService.invalidate_cache()
+
+
+def _search(term):
+    users = UserDataService.load_users_data(search_value=term)
+    return [u["username"] for u in users]
+
+
+@pytest.mark.usefixtures("users_db")
+def test_search_treats_underscore_literally():
+    """An "_" in the search term must not match any single character."""
+    assert _search("test_user") == ["test_user"]
+    assert UserDataService.count_users(search_value="test_user") == 1
+
+
+@pytest.mark.usefixtures("users_db")
+def test_search_treats_percent_literally():
+    """A "%" in the search term matches only values containing "%"."""
+    assert _search("%") == ["percent"]
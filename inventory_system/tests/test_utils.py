@@ -1,15 +1,25 @@
 import os
-import time
-from pathlib import Path
+from functools import cache
 
-import pytest
-import requests
-from playwright.sync_api import sync_playwright
-from reflex.testing import AppHarness
+import reflex as rx
+import reflex_local_auth
+from sqlmodel import delete, select
 
+from inventory_system.models.user import Supplier, UserInfo, UserRole
 
+# Test user shared by the auth and profile flows
+TEST_USERNAME = "test_user"
+TEST_PASSWORD = "Test@1234"  # Meets password requirements
+TEST_EMAIL = "test@example.com"
+TEST_ID = "12345"
+
+
+@cache
 def get_wsl_host():
-    """Get the appropriate host IP for the environment (WSL, Linux, or others)."""
+    """Get the appropriate host IP for the environment (WSL, Linux, or others).
+
+    Cached: the host does not change during a test run.
+    """
     # Allow override via environment variable for flexibility
     if os.environ.get("TEST_HOST"):
         return os.environ.get("TEST_HOST")
@@ -39,59 +49,19 @@ def get_wsl_host():
     return "localhost"
 
 
-@pytest.fixture(scope="session")
-def inventory_app():
-    """Start the inventory app using AppHarness."""
-    with AppHarness.create(
-        root=Path(__file__).parent.parent.parent, app_name="inventory_system"
-    ) as harness:
-        assert harness.frontend_url, "Frontend URL unavailable"
-        wsl_host = get_wsl_host()
-        frontend_urls = [
-            harness.frontend_url,
-            harness.frontend_url.replace("localhost", "127.0.0.1"),
-            harness.frontend_url.replace("localhost", wsl_host),
-        ]
-        print(f"Starting app, trying URLs: {frontend_urls}")
-        start_time = time.time()
-        timeout = 90
-        responsive_url = None
-        for url in frontend_urls:
-            print(f"Testing {url}/login")
-            while time.time() - start_time < timeout:
-                try:
-                    response = requests.get(
-                        f"{url}/login", timeout=5, allow_redirects=True
-                    )
-                    print(f"Response status: {response.status_code} for {url}/login")
-                    if response.status_code == 200:
-                        print(f"Frontend responsive at {url}")
-                        responsive_url = url
-                        break
-                except requests.RequestException as e:
-                    print(
-                        f"Waiting for frontend... ({time.time() - start_time:.1f}s, error: {e})"  # noqa: E501
-                    )
-                time.sleep(1)
-            if responsive_url:
-                break
-        else:
-            raise RuntimeError(f"Frontend did not respond within {timeout}s")
-        if responsive_url != harness.frontend_url:
-            harness.frontend_url = responsive_url
-        yield harness
-
+def delete_test_users(usernames):
+    """Delete test users and their UserInfo, roles and Supplier records.
 
-@pytest.fixture
-def edge_page():
-    """Provide a Playwright page running in Microsoft Edge."""
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(channel="chromium", headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-        page.set_default_timeout(20000)
-        page.set_default_navigation_timeout(25000)
-        page.on("console", lambda msg: print(f"Console: {msg.text}"))
-        yield page
-        context.close()
-        browser.close()
+    Issues one set-based DELETE per table regardless of how many users
+    match, instead of loading and deleting each row through the ORM.
+    """
+    LocalUser = reflex_local_auth.LocalUser
+    user_ids = select(LocalUser.id).where(LocalUser.username.in_(usernames))
+    info_ids = select(UserInfo.id).where(UserInfo.user_id.in_(user_ids))
+    with rx.session() as session:
+        # Children first; Supplier.user_info_id is ON DELETE SET NULL
+        session.exec(delete(Supplier).where(Supplier.user_info_id.in_(info_ids)))
+        session.exec(delete(UserRole).where(UserRole.user_id.in_(info_ids)))
+        session.exec(delete(UserInfo).where(UserInfo.user_id.in_(user_ids)))
+        session.exec(delete(LocalUser).where(LocalUser.username.in_(usernames)))
+        session.commit()